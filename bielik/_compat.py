@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Lazy imports and optional dependencies shared across Bielik.
+"""
+
+import importlib.util
+import json
+from functools import lru_cache
+from typing import Any
+
+# llama-cpp-python is detected without importing it, since the import loads
+# its native library; a broken install surfaces as an ImportError when the
+# first model is loaded
+HAS_LLAMA_CPP = importlib.util.find_spec("llama_cpp") is not None
+
+# orjson (the 'fast' extra) encodes and decodes JSON several times faster
+# than the stdlib, which stays the fallback
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def json_loads(data: Any) -> Any:
+    """Parse JSON from str or bytes."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps_pretty(obj: Any) -> bytes:
+    """Serialize to UTF-8 JSON indented by 2 spaces, non-ASCII text unescaped."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+@lru_cache(maxsize=None)
+def hf_models():
+    """Return the bielik.hf_models module, importing it on first use."""
+    from . import hf_models
+    return hf_models
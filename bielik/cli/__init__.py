@@ -7,8 +7,20 @@ supporting both Ollama integration and direct Hugging Face model execution.
 """
 
 from .main import main
-from .commands import CommandProcessor
-from .setup import SetupManager
-from .models import ModelManager as CLIModelManager
 
 __all__ = ['main', 'CommandProcessor', 'SetupManager', 'CLIModelManager']
+
+
+def __getattr__(name):
+    # Resolved lazily: these pull in the HF model layer, which the `bielik`
+    # entry point should not pay for before it knows a model is needed
+    if name == 'CommandProcessor':
+        from .commands import CommandProcessor
+        return CommandProcessor
+    if name == 'SetupManager':
+        from .setup import SetupManager
+        return SetupManager
+    if name == 'CLIModelManager':
+        from .models import ModelManager
+        return ModelManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,12 +6,16 @@ This module provides the base classes and utilities for creating custom
 commands that can be dynamically loaded by the CLI.
 """
 
+import importlib.util
 import json
 import os
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, FrozenSet, List, Optional, Any, Tuple
 from pathlib import Path
 
+# Command names are plain identifiers, as used for ":name" and "name:"
+COMMAND_NAME_PATTERN = r'[A-Za-z_][A-Za-z0-9_-]*'
+
 
 class CommandBase(ABC):
     """Base class for all CLI commands."""
@@ -202,6 +206,7 @@ class CommandRegistry:
         self.commands_dir = Path(commands_dir)
         self.commands: Dict[str, CommandBase] = {}
         self.command_metadata: Dict[str, Dict[str, Any]] = {}
+        self._command_names: Optional[FrozenSet[str]] = None
     
     def discover_commands(self) -> List[str]:
         """Discover available commands in the commands directory."""
@@ -229,7 +234,6 @@ class CommandRegistry:
         
         try:
             # Dynamic import
-            import importlib.util
             spec = importlib.util.spec_from_file_location(
                 f"bielik_command_{command_name}", 
                 command_path
@@ -274,9 +278,31 @@ class CommandRegistry:
         """Get a command by name, loading it if necessary."""
         return self.load_command(command_name)
     
+    def get(self, command_name: str) -> Optional[CommandBase]:
+        """Get an available command by name, or None if there is no such command.
+        
+        Unlike get_command, unknown names are rejected by a set lookup
+        without touching the filesystem.
+        """
+        if command_name not in self.command_names():
+            return None
+        return self.load_command(command_name)
+    
+    def command_names(self) -> FrozenSet[str]:
+        """Names of available commands, discovered once and cached."""
+        if self._command_names is None:
+            self._command_names = frozenset(self.discover_commands())
+        return self._command_names
+    
+    def invalidate(self):
+        """Forget cached command names so the next lookup rescans the directory."""
+        self._command_names = None
+    
     def list_commands(self) -> List[str]:
         """List all available commands."""
-        return self.discover_commands()
+        commands = self.discover_commands()
+        self._command_names = frozenset(commands)
+        return commands
     
     def get_command_help(self, command_name: str) -> str:
         """Get help text for a command."""
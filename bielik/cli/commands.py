@@ -8,15 +8,38 @@ including special commands like :help, :status, :models, etc.
 
 import json
 import os
-from typing import List, Dict, Optional, Tuple
+import re
+import sys
+from dataclasses import dataclass
+from typing import List, Dict, Literal, Optional
 from huggingface_hub import snapshot_download
 from .setup import SetupManager
 from .models import ModelManager
 from .settings import get_cli_settings
-from .command_api import get_command_registry
+from .command_api import COMMAND_NAME_PATTERN, get_command_registry
 from ..config import get_config, get_logger
 
 
+# Context provider names are plain identifiers; anything else before the first
+# ':' (URLs, times, ratios, whole sentences) can be rejected without a registry lookup
+_CTX_NAME_RE = re.compile(rf'^{COMMAND_NAME_PATTERN}$')
+
+
+@dataclass
+class CommandResult:
+    """
+    Outcome of a special command for the interactive chat loop.
+    
+    kind tells the loop what else to do: "switch_model" carries the new
+    model name in model, "context" carries Context Provider output in context.
+    """
+    continue_chat: bool
+    messages: List[Dict]
+    kind: Literal["none", "switch_model", "context"] = "none"
+    model: Optional[str] = None
+    context: Optional[str] = None
+
+
 class CommandProcessor:
     """Processes and executes CLI commands."""
     
@@ -30,34 +53,60 @@ class CommandProcessor:
         # Initialize dynamic command registry
         self.command_registry = get_command_registry()
         
+        # Built-in commands by exact name: {":name": handler(name, arg, messages, current_model)}
+        self._builtin_handlers = {
+            ":exit": self._cmd_exit,
+            ":quit": self._cmd_exit,
+            ":q": self._cmd_exit,
+            ":help": self._cmd_help,
+            ":clear": self._cmd_clear,
+            ":setup": self._cmd_setup,
+            ":models": self._cmd_models,
+            ":download": self._cmd_download,
+            ":delete": self._cmd_delete,
+            ":storage": self._cmd_storage,
+            ":switch": self._cmd_switch,
+            ":model": self._cmd_switch,
+            ":name": self._cmd_name,
+            ":settings": self._cmd_settings,
+            ":cache": self._cmd_cache,
+            ":download-bielik": self._cmd_download_bielik,
+        }
+        
     def show_welcome(self) -> None:
         """Display welcome message and help for beginners."""
+        sys.stdout.write(self.get_welcome_text() + "\n")
+        sys.stdout.flush()
+    
+    def get_welcome_text(self) -> str:
+        """Build the welcome message and help for beginners as one string."""
+        lines = []
         assistant_name = self.settings.get_assistant_name()
         user_name = self.settings.get_user_name()
         
-        print("🦅 " + "="*50)
-        print(f"   {assistant_name.upper()} - Polish AI Assistant")
-        print("   Powered by HuggingFace + SpeakLeash")
-        print("="*53)
-        print()
-        print(f"👋 Welcome {user_name}!")
-        print()
-        print("📋 Built-in Commands:")
-        print("  :help    - show this help")
-        print("  :setup   - show HF model setup information")
-        print("  :clear   - clear conversation history")
-        print("  :models  - show available HF models")
-        print("  :download <model> - download HF model (auto-switches)")
-        print("  :delete <model>   - delete downloaded model")
-        print("  :switch <model>   - switch to model")
-        print("  :model <model>    - switch to model (alias for :switch)")
-        print("  :storage - show storage statistics")
-        print("  :name <name>      - change your display name")
-        print("  :settings         - show current settings")
-        print("  :cache            - clear model cache (free memory)")
-        print("  :download-bielik  - download Polish Bielik models from HuggingFace")
-        print("  :exit    - end session")
-        print("  Ctrl+C   - quick exit")
+        lines.append("🦅 " + "="*50)
+        lines.append(f"   {assistant_name.upper()} - Polish AI Assistant")
+        lines.append("   Powered by HuggingFace + SpeakLeash")
+        lines.append("="*53)
+        lines.append("")
+        lines.append(f"👋 Welcome {user_name}!")
+        lines.append("")
+        lines.append("📋 Built-in Commands:")
+        lines.append("  :help    - show this help")
+        lines.append("  :setup   - show HF model setup information")
+        lines.append("  :clear   - clear conversation history")
+        lines.append("  :models  - show available HF models")
+        lines.append("  :download <model> - download HF model (auto-switches)")
+        lines.append("  :delete <model>   - delete downloaded model")
+        lines.append("  :switch <model>   - switch to model")
+        lines.append("  :model <model>    - switch to model (alias for :switch)")
+        lines.append("  :storage - show storage statistics")
+        lines.append("  :name <name>      - change your display name")
+        lines.append("  :settings         - show current settings")
+        lines.append("  :cache            - clear model cache (free memory)")
+        lines.append("  :download-bielik  - download Polish Bielik models from HuggingFace")
+        lines.append("  :exit    - end session")
+        lines.append("  Ctrl+C   - quick exit")
         
         # Show dynamic commands separated by type
         dynamic_commands = self.command_registry.list_commands()
@@ -76,29 +125,31 @@ class CommandProcessor:
             
             # Show direct extension commands
             if direct_commands:
-                print()
-                print("🔧 Extension Commands:")
+                lines.append("")
+                lines.append("🔧 Extension Commands:")
                 for cmd_name, description in direct_commands:
-                    print(f"  :{cmd_name}  - {description}")
-                print("  Use ':<command> help' for detailed help on any extension command")
+                    lines.append(f"  :{cmd_name}  - {description}")
+                lines.append("  Use ':<command> help' for detailed help on any extension command")
             
             # Show context provider commands
             if context_providers:
-                print()
-                print("📊 Context Providers:")
+                lines.append("")
+                lines.append("📊 Context Providers:")
                 for cmd_name, description in context_providers:
-                    print(f"  {cmd_name}:  - {description}")
-                print("  These commands provide context for AI analysis.")
-                print("  Example: folder: ~/documents → then ask AI questions about the directory")
-        print()
-        print("💡 Tips:")
-        print("  • Write in Polish - AI understands Polish!")
-        print("  • Ask questions, request help, chat naturally")
-        print("  • Include image/folder paths for automatic analysis")
-        print("  • Local HF models provide fast, private AI responses")
-        print()
+                    lines.append(f"  {cmd_name}:  - {description}")
+                lines.append("  These commands provide context for AI analysis.")
+                lines.append("  Example: folder: ~/documents → then ask AI questions about the directory")
+        lines.append("")
+        lines.append("💡 Tips:")
+        lines.append("  • Write in Polish - AI understands Polish!")
+        lines.append("  • Ask questions, request help, chat naturally")
+        lines.append("  • Include image/folder paths for automatic analysis")
+        lines.append("  • Local HF models provide fast, private AI responses")
+        lines.append("")
+        
+        return "\n".join(lines)
     
-    def process_command(self, command: str, messages: List[Dict], current_model: str) -> Tuple[bool, Optional[str], List[Dict]]:
+    def process_command(self, command: str, messages: List[Dict], current_model: str) -> CommandResult:
         """
         Process a special command.
         
@@ -108,181 +159,177 @@ class CommandProcessor:
             current_model: Currently active model
             
         Returns:
-            Tuple of (continue_chat, new_model, updated_messages)
-            - continue_chat: False if should exit, True to continue
-            - new_model: New model name if changed, None if no change
-            - updated_messages: Updated message list (e.g., cleared)
+            CommandResult with continue_chat (False to exit), the updated
+            message list (e.g., cleared) and, if any, the new model or context
         """
         command = command.strip()
         
-        # Exit commands
-        if command in [":exit", ":quit", ":q"]:
-            print("👋 Goodbye!")
-            return False, None, messages
-        
-        # Help command
-        elif command == ":help":
-            self.show_welcome()
-            return True, None, messages
-        
-        # Clear command
-        elif command == ":clear":
-            system_prompt = ("You are Bielik, a helpful Polish AI assistant. "
-                           "Respond in Polish unless asked otherwise.")
-            new_messages = [{"role": "system", "content": system_prompt}]
-            print("🧹 Conversation history cleared.")
-            return True, None, new_messages
-        
-        # Setup command - show HF model setup information
-        elif command == ":setup":
-            print("🔧 HuggingFace Model Setup Information:")
-            print()
-            print("📦 Available SpeakLeash Models:")
-            print("  • bielik-7b-instruct")
-            print("  • bielik-4.5b-v3.0-instruct")
-            print()
-            print("💡 How to get started:")
-            print("  1. Download a model: :download bielik-4.5b-v3.0-instruct")
-            print("  2. Switch to model: :switch bielik-4.5b-v3.0-instruct")
-            print("  3. Start chatting!")
-            print()
-            print("🔍 Check current status:")
-            print("  • :models - show available models")
-            print("  • :storage - show storage usage")
-            print("  • :settings - show current configuration")
-            print()
-            # Check current setup
-            from ..hf_models import HAS_LLAMA_CPP, get_model_manager
-            hf_manager = get_model_manager()
-            
-            if not HAS_LLAMA_CPP:
-                print("❌ llama-cpp-python not installed")
-                print("💡 Install with: conda install -c conda-forge llama-cpp-python")
-            else:
-                print("✅ llama-cpp-python is available")
-                
-            downloaded = hf_manager.list_downloaded_models()
-            if downloaded:
-                print(f"✅ {len(downloaded)} model(s) downloaded")
-            else:
-                print("⚠️  No models downloaded yet")
-            print()
-            return True, None, messages
-        
-        # Models command
-        elif command == ":models":
-            self.model_manager.show_models()
-            return True, None, messages
-        
-        # Download command with auto-switch
-        elif command.startswith(":download"):
-            parts = command.split(None, 1)
-            if len(parts) > 1:
-                model_name = parts[1]
-                success = self.model_manager.download_model(model_name)
-                
-                # Auto-switch to downloaded model if enabled and download was successful
-                if success and self.settings.should_auto_switch_after_download():
-                    print(f"🔄 Auto-switching to downloaded model: {model_name}")
-                    new_model = self.model_manager.get_full_model_name(model_name)
-                    if new_model:
-                        self.settings.set_current_model(new_model)
-                        print(f"✅ Switched to model: {self.settings.get_assistant_name()}")
-                        return True, new_model, messages
-                    else:
-                        print("⚠️ Could not determine full model name for auto-switch")
-                
-            else:
-                print("❓ Usage: :download <model_name>")
-            return True, None, messages
-        
-        # Delete command
-        elif command.startswith(":delete"):
-            parts = command.split(None, 1)
-            if len(parts) > 1:
-                self.model_manager.delete_model(parts[1])
-            else:
-                print("❓ Usage: :delete <model_name>")
-            return True, None, messages
-        
-        # Storage command
-        elif command == ":storage":
-            self.model_manager.show_storage_stats()
-            return True, None, messages
-        
-        # Switch command (and :model alias)
-        elif command.startswith(":switch") or command.startswith(":model"):
-            parts = command.split(None, 1)
-            if len(parts) > 1:
-                new_model = self.model_manager.switch_model(parts[1], current_model)
-                if new_model:
-                    # Update settings with new model
-                    self.settings.set_current_model(new_model)
-                    print(f"✅ Assistant name updated to: {self.settings.get_assistant_name()}")
-                return True, new_model, messages
-            else:
-                cmd_name = ":switch" if command.startswith(":switch") else ":model"
-                print(f"❓ Usage: {cmd_name} <model_name>")
-                return True, None, messages
-        
-        # Name command - change user display name
-        elif command.startswith(":name"):
-            parts = command.split(None, 1)
-            if len(parts) > 1:
-                new_name = parts[1]
-                if self.settings.set_user_name(new_name):
-                    print(f"✅ Your display name changed to: {self.settings.get_user_name()}")
-                else:
-                    print("❌ Could not change display name")
-            else:
-                print("❓ Usage: :name <your_name>")
-                print(f"Current name: {self.settings.get_user_name()}")
-            return True, None, messages
-        
-        # Settings command - show current settings
-        elif command == ":settings":
-            settings = self.settings.get_settings_summary()
-            print("⚙️ Current CLI Settings:")
-            print(f"  👤 User name: {settings['user_name']}")
-            print(f"  🤖 Assistant name: {settings['assistant_name']}")
-            print(f"  📦 Current model: {settings['current_model'] or 'Default'}")
-            print(f"  🔄 Auto-switch after download: {settings['auto_switch']}")
-            print(f"  📄 Settings file: {settings['env_file_path']}")
-            print(f"  💾 File exists: {'✅' if settings['env_file_exists'] else '❌'}")
-            return True, None, messages
-        
-        # Cache command - clear model cache to free memory
-        elif command == ":cache":
-            from .send_chat import get_chat_communicator
-            communicator = get_chat_communicator()
-            communicator.clear_model_cache()
-            print("🧹 Model cache cleared - memory freed")
-            print("💡 Next prompt will reload the model (~5-6 seconds)")
-            return True, None, messages
-        
-        # Download Bielik models command
-        elif command.startswith(":download-bielik"):
-            parts = command.split(None, 1)
-            if len(parts) > 1:
-                model_identifier = parts[1]
-                return self._handle_bielik_download(model_identifier, current_model)
-            else:
-                self._show_bielik_models()
-                return True, None, messages
+        # Built-in commands are looked up by exact name; the rest of the line is the argument
+        parts = command.split(None, 1)
+        handler = self._builtin_handlers.get(parts[0]) if parts else None
+        if handler is not None:
+            arg = parts[1] if len(parts) > 1 else ""
+            return handler(parts[0], arg, messages, current_model)
         
         # Check for dynamic/extension commands
+        # Handle both formats: :command and command:
+        is_context_provider = self._is_context_provider_command(command)
+        
+        if is_context_provider:
+            # Context provider format: "folder: ~/documents"
+            return self._handle_context_provider(command, current_model, messages)
         else:
-            # Handle both formats: :command and command:
-            is_context_provider = self._is_context_provider_command(command)
+            # Direct command format: ":calc 2+3"
+            return self._handle_direct_command(command, current_model, messages)
+    
+    def _cmd_exit(self, name: str, arg: str, messages: List[Dict], current_model: str) -> CommandResult:
+        """Handle :exit, :quit and :q."""
+        print("👋 Goodbye!")
+        return CommandResult(False, messages)
+    
+    def _cmd_help(self, name: str, arg: str, messages: List[Dict], current_model: str) -> CommandResult:
+        """Handle :help."""
+        self.show_welcome()
+        return CommandResult(True, messages)
+    
+    def _cmd_clear(self, name: str, arg: str, messages: List[Dict], current_model: str) -> CommandResult:
+        """Handle :clear."""
+        system_prompt = ("You are Bielik, a helpful Polish AI assistant. "
+                       "Respond in Polish unless asked otherwise.")
+        new_messages = [{"role": "system", "content": system_prompt}]
+        print("🧹 Conversation history cleared.")
+        return CommandResult(True, new_messages)
+    
+    def _cmd_setup(self, name: str, arg: str, messages: List[Dict], current_model: str) -> CommandResult:
+        """Handle :setup - show HF model setup information."""
+        print("🔧 HuggingFace Model Setup Information:")
+        print()
+        print("📦 Available SpeakLeash Models:")
+        print("  • bielik-7b-instruct")
+        print("  • bielik-4.5b-v3.0-instruct")
+        print()
+        print("💡 How to get started:")
+        print("  1. Download a model: :download bielik-4.5b-v3.0-instruct")
+        print("  2. Switch to model: :switch bielik-4.5b-v3.0-instruct")
+        print("  3. Start chatting!")
+        print()
+        print("🔍 Check current status:")
+        print("  • :models - show available models")
+        print("  • :storage - show storage usage")
+        print("  • :settings - show current configuration")
+        print()
+        # Check current setup
+        from ..hf_models import HAS_LLAMA_CPP, get_model_manager
+        hf_manager = get_model_manager()
+        
+        if not HAS_LLAMA_CPP:
+            print("❌ llama-cpp-python not installed")
+            print("💡 Install with: conda install -c conda-forge llama-cpp-python")
+        else:
+            print("✅ llama-cpp-python is available")
             
-            if is_context_provider:
-                # Context provider format: "folder: ~/documents"
-                return self._handle_context_provider(command, current_model, messages)
+        downloaded = hf_manager.list_downloaded_models()
+        if downloaded:
+            print(f"✅ {len(downloaded)} model(s) downloaded")
+        else:
+            print("⚠️  No models downloaded yet")
+        print()
+        return CommandResult(True, messages)
+    
+    def _cmd_models(self, name: str, arg: str, messages: List[Dict], current_model: str) -> CommandResult:
+        """Handle :models."""
+        self.model_manager.show_models()
+        return CommandResult(True, messages)
+    
+    def _cmd_download(self, name: str, arg: str, messages: List[Dict], current_model: str) -> CommandResult:
+        """Handle :download <model>, auto-switching to it if enabled."""
+        if not arg:
+            print("❓ Usage: :download <model_name>")
+            return CommandResult(True, messages)
+        
+        model_name = arg
+        success = self.model_manager.download_model(model_name)
+        
+        # Auto-switch to downloaded model if enabled and download was successful
+        if success and self.settings.should_auto_switch_after_download():
+            print(f"🔄 Auto-switching to downloaded model: {model_name}")
+            new_model = self.model_manager.get_full_model_name(model_name)
+            if new_model:
+                self.settings.set_current_model(new_model)
+                print(f"✅ Switched to model: {self.settings.get_assistant_name()}")
+                return CommandResult(True, messages, kind="switch_model", model=new_model)
             else:
-                # Direct command format: ":calc 2+3"
-                return self._handle_direct_command(command, current_model, messages)
-            
-    def _handle_context_provider(self, command: str, current_model: str, messages: list) -> tuple:
+                print("⚠️ Could not determine full model name for auto-switch")
+        return CommandResult(True, messages)
+    
+    def _cmd_delete(self, name: str, arg: str, messages: List[Dict], current_model: str) -> CommandResult:
+        """Handle :delete <model>."""
+        if arg:
+            self.model_manager.delete_model(arg)
+        else:
+            print("❓ Usage: :delete <model_name>")
+        return CommandResult(True, messages)
+    
+    def _cmd_storage(self, name: str, arg: str, messages: List[Dict], current_model: str) -> CommandResult:
+        """Handle :storage."""
+        self.model_manager.show_storage_stats()
+        return CommandResult(True, messages)
+    
+    def _cmd_switch(self, name: str, arg: str, messages: List[Dict], current_model: str) -> CommandResult:
+        """Handle :switch <model> and its :model alias."""
+        if not arg:
+            print(f"❓ Usage: {name} <model_name>")
+            return CommandResult(True, messages)
+        
+        new_model = self.model_manager.switch_model(arg, current_model)
+        if new_model:
+            # Update settings with new model
+            self.settings.set_current_model(new_model)
+            print(f"✅ Assistant name updated to: {self.settings.get_assistant_name()}")
+            return CommandResult(True, messages, kind="switch_model", model=new_model)
+        return CommandResult(True, messages)
+    
+    def _cmd_name(self, name: str, arg: str, messages: List[Dict], current_model: str) -> CommandResult:
+        """Handle :name <name> - change user display name."""
+        if arg:
+            if self.settings.set_user_name(arg):
+                print(f"✅ Your display name changed to: {self.settings.get_user_name()}")
+            else:
+                print("❌ Could not change display name")
+        else:
+            print("❓ Usage: :name <your_name>")
+            print(f"Current name: {self.settings.get_user_name()}")
+        return CommandResult(True, messages)
+    
+    def _cmd_settings(self, name: str, arg: str, messages: List[Dict], current_model: str) -> CommandResult:
+        """Handle :settings - show current settings."""
+        settings = self.settings.get_settings_summary()
+        print("⚙️ Current CLI Settings:")
+        print(f"  👤 User name: {settings['user_name']}")
+        print(f"  🤖 Assistant name: {settings['assistant_name']}")
+        print(f"  📦 Current model: {settings['current_model'] or 'Default'}")
+        print(f"  🔄 Auto-switch after download: {settings['auto_switch']}")
+        print(f"  📄 Settings file: {settings['env_file_path']}")
+        print(f"  💾 File exists: {'✅' if settings['env_file_exists'] else '❌'}")
+        return CommandResult(True, messages)
+    
+    def _cmd_cache(self, name: str, arg: str, messages: List[Dict], current_model: str) -> CommandResult:
+        """Handle :cache - clear model cache to free memory."""
+        from .send_chat import get_chat_communicator
+        communicator = get_chat_communicator()
+        communicator.clear_model_cache()
+        print("🧹 Model cache cleared - memory freed")
+        print("💡 Next prompt will reload the model (~5-6 seconds)")
+        return CommandResult(True, messages)
+    
+    def _cmd_download_bielik(self, name: str, arg: str, messages: List[Dict], current_model: str) -> CommandResult:
+        """Handle :download-bielik [model] - download Polish Bielik models."""
+        if arg:
+            return self._handle_bielik_download(arg, current_model, messages)
+        self._show_bielik_models()
+        return CommandResult(True, messages)
+    
+    def _handle_context_provider(self, command: str, current_model: str, messages: list) -> CommandResult:
         """Handle context provider commands (format: 'name: args')."""
         try:
             # Parse command: "folder: ~/documents" 
@@ -294,7 +341,7 @@ class CommandProcessor:
             dynamic_command = self.command_registry.get_command(cmd_name)
             if not dynamic_command:
                 print(f"❌ Unknown context provider command: {cmd_name}")
-                return True, None, messages
+                return CommandResult(True, messages)
             
             # Prepare context for dynamic command
             context = {
@@ -322,7 +369,7 @@ class CommandProcessor:
                 result = self.command_registry.execute_command(cmd_name, args, context)
                 
                 # ✅ FIX: Return True to continue chat, context data for interactive loop
-                return True, result, messages
+                return self._context_result(result, messages)
             else:
                 # Fallback to normal execution if command doesn't have provide_context
                 result = self.command_registry.execute_command(cmd_name, args, context)
@@ -334,14 +381,21 @@ class CommandProcessor:
                     self._display_context_provider_result(cmd_name, result)
                     
                     # ✅ FIX: Return True to continue chat, context data for interactive loop
-                    return True, result, messages
+                    return self._context_result(result, messages)
                 else:
                     print(f"❌ No context generated: {result}")
-                    return True, None, messages
+                    return CommandResult(True, messages)
                 
         except Exception as e:
             print(f"❌ Context provider command failed: {e}")
-            return True, None, messages
+            return CommandResult(True, messages)
+    
+    @staticmethod
+    def _context_result(result: Optional[str], messages: list) -> CommandResult:
+        """Wrap Context Provider output; blank output loads no context."""
+        if isinstance(result, str) and result.strip():
+            return CommandResult(True, messages, kind="context", context=result)
+        return CommandResult(True, messages)
     
     def _display_context_provider_result(self, cmd_name: str, result):
         """Display context provider results to user in a friendly format."""
@@ -425,7 +479,7 @@ class CommandProcessor:
         else:
             print("📄 PDF processed successfully")
     
-    def _handle_direct_command(self, command: str, current_model: str, messages: list) -> tuple:
+    def _handle_direct_command(self, command: str, current_model: str, messages: list) -> CommandResult:
         """Handle direct extension commands (format: ':command args')."""
         try:
             # Extract command name (remove ':' prefix)
@@ -448,18 +502,18 @@ class CommandProcessor:
                 # Execute dynamic command
                 result = self.command_registry.execute_command(cmd_name, args, context)
                 print(result)
-                return True, None, messages
+                return CommandResult(True, messages)
                 
             else:
                 # Unknown command
                 help_msg = (f"❓ Unknown command: {command}. "
                            "Type :help to see available commands.")
                 print(help_msg)
-                return True, None, messages
+                return CommandResult(True, messages)
                 
         except Exception as e:
             print(f"❌ Extension command failed: {e}")
-            return True, None, messages
+            return CommandResult(True, messages)
     
     def is_command(self, user_input: str) -> bool:
         """Check if user input is a command."""
@@ -476,16 +530,14 @@ class CommandProcessor:
     
     def _is_context_provider_command(self, user_input: str) -> bool:
         """Check if input matches context provider format: 'command: args'"""
-        if ':' not in user_input:
+        idx = user_input.find(':')
+        if idx == -1:
             return False
         
-        # Split on first colon
-        parts = user_input.split(':', 1)
-        if len(parts) != 2:
+        command_name = user_input[:idx].strip()
+        if not _CTX_NAME_RE.match(command_name):
             return False
         
-        command_name = parts[0].strip()
-        
         # Check if this command exists in registry and is a context provider
         dynamic_command = self.command_registry.get_command(command_name)
         return dynamic_command is not None and getattr(dynamic_command, 'is_context_provider', False)
@@ -542,7 +594,9 @@ class CommandProcessor:
                     print(f"    ID: {model_id}")
             print()
         
-        # Show all categories
+        # Show all categories - each model block is rendered into one string
+        # and the whole listing is written at once instead of print-per-line
+        blocks = []
         for category, category_models in models.items():
             if not category_models:
                 continue
@@ -555,14 +609,17 @@ class CommandProcessor:
                 'compressed': '📦 Compressed Models'
             }.get(category, f'📁 {category.title()} Models')
             
-            print(category_title)
+            blocks.append(f"{category_title}\n")
             for model_id, model_info in category_models.items():
                 status = "⭐ RECOMMENDED" if model_info.get('recommended') else ""
-                print(f"  • {model_info['name']} {status}")
-                print(f"    ID: {model_id}")
-                print(f"    Type: {model_info['type']} | Size: {model_info['size']} | Format: {model_info['format']}")
-                print(f"    {model_info['description']}")
-                print()
+                blocks.append(
+                    f"  • {model_info['name']} {status}\n"
+                    f"    ID: {model_id}\n"
+                    f"    Type: {model_info['type']} | Size: {model_info['size']} | Format: {model_info['format']}\n"
+                    f"    {model_info['description']}\n"
+                    f"\n"
+                )
+        sys.stdout.write("".join(blocks))
         
         print("💡 Usage:")
         print("  :download-bielik <model_id>    - Download specific model")
@@ -576,7 +633,7 @@ class CommandProcessor:
                 return category_models[model_id]
         return None
     
-    def _handle_bielik_download(self, model_identifier: str, current_model: str) -> tuple:
+    def _handle_bielik_download(self, model_identifier: str, current_model: str, messages: list) -> CommandResult:
         """Handle Bielik model download."""
         models_data = self._load_bielik_models()
         models = models_data.get('bielik_models', {})
@@ -591,7 +648,7 @@ class CommandProcessor:
         if not model_info:
             print(f"❌ Model '{model_identifier}' not found in Bielik registry")
             print("💡 Use ':download-bielik' to see available models")
-            return True, None, []
+            return CommandResult(True, messages)
         
         try:
             print(f"🦅 Downloading Bielik model: {model_info['name']}")
@@ -648,10 +705,10 @@ class CommandProcessor:
             except Exception as e:
                 self.logger.warning(f"Failed to cache model info: {e}")
             
-            return True, None, []
+            return CommandResult(True, messages)
             
         except Exception as e:
             self.logger.error(f"Failed to download Bielik model {model_identifier}: {e}")
             print(f"❌ Download failed: {e}")
             print(f"💡 Check your internet connection and try again")
-            return True, None, []
+            return CommandResult(True, messages)
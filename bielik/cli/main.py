@@ -6,11 +6,17 @@ This module provides the main entry point for the Bielik CLI application,
 including argument parsing and the interactive chat loop.
 """
 
+import os
 import sys
+import json
 import argparse
 import warnings
 import re
-from typing import List, Dict
+import time
+from collections import namedtuple
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional
 
 # Suppress deprecation warnings (e.g., CryptographyDeprecationWarning from pypdf)
 warnings.filterwarnings("ignore", category=DeprecationWarning)
@@ -20,134 +26,254 @@ try:
 except Exception:
     pass
 
-from .commands import CommandProcessor
-from .send_chat import send_chat
-from .setup import SetupManager
+from .command_api import COMMAND_NAME_PATTERN
 from .settings import get_cli_settings
+from .._compat import hf_models as _hf_models
 from ..config import get_config, get_logger
-from ..content_processor import get_content_processor
-from ..hf_models import get_model_manager
+from ..models.model_files import atomic_write, get_bielik_cache_dir
+
+
+# Heavy subsystems (llama-cpp, the HF model registry, HTML/PDF parsers) are
+# imported on first use, so `--help` and pure `:command` prompts start fast.
+
+@lru_cache(maxsize=None)
+def _chat_api():
+    """Return the bielik.cli.send_chat module, importing it on first use."""
+    from . import send_chat
+    return send_chat
+
+
+@lru_cache(maxsize=None)
+def _content_processor():
+    """Return the shared ContentProcessor, importing it on first use."""
+    from ..content_processor import get_content_processor
+    return get_content_processor()
+
+
+@lru_cache(maxsize=None)
+def _command_registry():
+    """Return the shared CommandRegistry, importing it on first use."""
+    from .command_api import get_command_registry
+    return get_command_registry()
+
+
+# ":command args" (CLI command) or "command: args" (Context Provider command);
+# URLs such as "https://..." match as a name but are not registered commands
+_CMD_RE = re.compile(
+    rf"^(?::(?P<cli_name>{COMMAND_NAME_PATTERN})(?:\s+(?P<cli_args>.*))?"
+    rf"|\s*(?P<ctx_name>{COMMAND_NAME_PATTERN})\s*:\s*(?P<ctx_args>.*))$",
+    re.DOTALL,
+)
+
+# Responses starting with any of these are errors and are kept out of the history
+ERROR_PREFIXES = ("[ERROR]", "[REST ERROR]", "[OLLAMA LIB ERROR]", "[LOCAL MODEL ERROR]")
+
+# Models found available at startup, keyed on the model registry's mtime
+MODELS_CACHE_FILE = get_bielik_cache_dir() / "models.json"
 
 
 def validate_model_availability(model_name: str, model_manager) -> bool:
-    """Check if a HuggingFace model is available locally."""
+    """
+    Check if a HuggingFace model is available locally.
+    
+    Positive results are cached in MODELS_CACHE_FILE, keyed on the registry
+    file's modification time, so an unchanged registry is not re-parsed on
+    every startup. A model not found is always checked again.
+    """
     try:
         # Check if it's a HuggingFace model and is downloaded
-        if model_name in model_manager.SPEAKLEASH_MODELS:
-            return model_manager.is_model_downloaded(model_name)
+        if model_name in model_manager.SPEAKLEASH_MODELS_SET:
+            registry_file = str(model_manager.registry_file)
+            return _cached_availability(model_manager, model_name, registry_file,
+                                        _registry_mtime_ns(registry_file))
         
         return False
     except Exception:
         return False
 
 
+def _registry_mtime_ns(registry_file: str) -> Optional[int]:
+    """Return the registry file's mtime in ns, or None if it does not exist."""
+    try:
+        return os.stat(registry_file).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _cached_availability(model_manager, model_name: str, registry_file: str,
+                         mtime_ns: Optional[int]) -> bool:
+    """Answer is_model_downloaded from the disk cache when the registry is unchanged."""
+    cache = _read_models_cache()
+    if cache.get("registry_file") != registry_file or cache.get("mtime_ns") != mtime_ns:
+        cache = {"registry_file": registry_file, "mtime_ns": mtime_ns, "available": []}
+    
+    available = cache.setdefault("available", [])
+    if model_name in available:
+        return True
+    
+    if not model_manager.is_model_downloaded(model_name):
+        return False
+    
+    # Adopting a model from the HF cache rewrites the registry
+    cache["mtime_ns"] = _registry_mtime_ns(registry_file)
+    available.append(model_name)
+    _write_models_cache(cache)
+    return True
+
+
+def _read_models_cache() -> Dict:
+    """Read the availability cache, returning an empty dict if it is missing or invalid."""
+    try:
+        with open(MODELS_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if isinstance(cache, dict) and isinstance(cache.get("available"), list):
+            return cache
+    except (OSError, ValueError):
+        pass
+    return {}
+
+
+def _write_models_cache(cache: Dict):
+    """Write the availability cache; failures only cost a cache miss."""
+    try:
+        atomic_write(MODELS_CACHE_FILE, json.dumps(cache).encode('utf-8'))
+    except OSError as e:
+        get_logger(__name__).debug(f"Could not write model cache {MODELS_CACHE_FILE}: {e}")
+
+
 def find_fallback_model(model_manager):
     """Find a working fallback HuggingFace model."""
     # Try to find downloaded HF models from registry
     try:
-        registry = model_manager.list_downloaded_models()
-        if registry:
-            # Get the first available HF model from registry
-            for model_name, model_info in registry.items():
-                if model_manager.is_model_downloaded(model_name):
-                    print(f"🔍 Found downloaded HF model: {model_name}")
-                    return model_name
+        # Any downloaded HF model will do; the manifest has already checked its file exists
+        for model_name in sorted(model_manager.downloaded_model_names()):
+            print(f"🔍 Found downloaded HF model: {model_name}")
+            return model_name
     except Exception as e:
         print(f"⚠️  Could not check HF models registry: {e}")
     
     return None
 
 
-def execute_prompt(prompt: str, model: str, use_local: bool = True) -> str:
-    """Execute a single prompt - handles both Context Provider Commands and AI model queries."""
-    from .send_chat import send_chat
-    from ..content_processor import get_content_processor
-    from ..hf_models import HAS_LLAMA_CPP
-    from .command_api import get_command_registry
-    
-    # Initialize components
-    content_processor = get_content_processor()
-    cli_settings = get_cli_settings()
-    hf_model_manager = get_model_manager()
-    command_registry = get_command_registry()
+def _system_prompt(cli_settings) -> str:
+    """Build the system prompt with the configured assistant name."""
+    assistant_name = cli_settings.get_assistant_name()
+    return (f"You are {assistant_name}, a helpful Polish AI assistant. "
+            f"Respond in Polish unless asked otherwise.")
+
+
+def _prompt_uses_model(prompt: str) -> bool:
+    """Decide whether a --prompt value will be sent to the model.
+
+    Direct CLI commands (":command args") run without a model; everything
+    else, including Context Provider commands, ends up as a model query.
+    """
+    p = prompt.strip()
+    if not p.startswith(":"):
+        return True
+    try:
+        # Check against dynamic command registry to detect CLI commands
+        registry = _command_registry()
+        cmd = registry.get(p[1:].split(" ", 1)[0].strip())
+        # Direct CLI command → no model required
+        if cmd and not getattr(cmd, "is_context_provider", False):
+            return False
+    except Exception:
+        # If detection fails, keep default behavior
+        pass
+    return True
+
+
+def stream_prompt(prompt: str, model: str, use_local: bool = True, *,
+                  content_processor=None, hf_model_manager=None,
+                  cli_settings=None, command_registry=None) -> Iterator[str]:
+    """
+    Execute a single prompt, yielding output as it is produced - handles both
+    Context Provider Commands and AI model queries. Command results and errors
+    arrive as a single chunk; model answers are streamed as they are generated.
+    
+    Components already built by the caller can be passed in; any left as
+    None are looked up here, and the model-related ones only once the prompt
+    turns out not to be a plain CLI command.
+    """
+    if cli_settings is None:
+        cli_settings = get_cli_settings()
+    if command_registry is None:
+        command_registry = _command_registry()
     
     # Placeholder for enhanced prompt constructed from Context Provider output
     cp_enhanced_prompt = None
     visible_context_output = None
 
     # Check if this is a CLI command (format: ":commandname args") or Context Provider Command (format: "commandname: args")
-    if ':' in prompt and not prompt.startswith('http'):
-        # Check for regular CLI command first (format: ":command args")
-        if prompt.startswith(':'):
-            parts = prompt[1:].split(' ', 1)  # Remove ':' and split on first space
-            potential_command = parts[0].strip()
-            command_args = parts[1].strip() if len(parts) > 1 else ""
-            
-            # Check if this command exists in the registry
-            available_commands = command_registry.list_commands()
-            if potential_command in available_commands:
-                command = command_registry.get_command(potential_command)
-                if command and not getattr(command, 'is_context_provider', False):
-                    # This is a regular CLI command - execute it independently of AI models
-                    try:
-                        context = {
-                            'current_model': model,
-                            'messages': [],
-                            'cli_settings': cli_settings
-                        }
-                        # Parse command arguments
-                        args = [f":{potential_command}"] + command_args.split() if command_args else [f":{potential_command}"]
-                        result = command_registry.execute_command(potential_command, args, context)
-                        return result
-                    except Exception as e:
-                        return f"❌ Error executing :{potential_command} command: {e}"
+    match = _CMD_RE.match(prompt)
+    # Check for regular CLI command first (format: ":command args")
+    if match and match['cli_name']:
+        potential_command = match['cli_name']
+        command_args = (match['cli_args'] or "").strip()
         
-        # Check for Context Provider Command (format: "commandname: args")
-        else:
-            parts = prompt.split(':', 1)
-            if len(parts) == 2:
-                potential_command = parts[0].strip()
-                command_args = parts[1].strip()
-                
-                # Check if this command exists in the registry
-                available_commands = command_registry.list_commands()
-                if potential_command in available_commands:
-                    command = command_registry.get_command(potential_command)
-                    if command and getattr(command, 'is_context_provider', False):
-                        # This is a Context Provider Command - expand inline and use with the LLM
-                        try:
-                            context = {
-                                'current_model': model,
-                                'messages': [],
-                                'cli_settings': cli_settings
-                            }
-                            # Parse command arguments
-                            args = [f"{potential_command}:"] + command_args.split() if command_args else [f"{potential_command}:"]
-                            context_result = command_registry.execute_command(potential_command, args, context)
-
-                            if context_result and not context_result.startswith("❌"):
-                                # Build a prompt that includes the produced context and a default instruction
-                                visible_context_output = (
-                                    f"=== Context from {potential_command}: ===\n{context_result}\n=== End Context ==="
-                                )
-                                cp_enhanced_prompt = (
-                                    f"{visible_context_output}\n\n---\n\n"
-                                    f"User question: Odpowiedz, uwzględniając powyższy kontekst."
-                                )
-                            else:
-                                return f"❌ No result from {potential_command}: command"
-                        except Exception as e:
-                            return f"❌ Error executing {potential_command}: command: {e}"
+        # Check if this command exists in the registry
+        command = command_registry.get(potential_command)
+        if command and not getattr(command, 'is_context_provider', False):
+            # This is a regular CLI command - execute it independently of AI models
+            try:
+                context = {
+                    'current_model': model,
+                    'messages': [],
+                    'cli_settings': cli_settings
+                }
+                # Parse command arguments
+                args = [f":{potential_command}"] + command_args.split() if command_args else [f":{potential_command}"]
+                result = command_registry.execute_command(potential_command, args, context)
+                yield result
+                return
+            except Exception as e:
+                yield f"❌ Error executing :{potential_command} command: {e}"
+                return
+
+    # Check for Context Provider Command (format: "commandname: args")
+    elif match and match['ctx_name']:
+        potential_command = match['ctx_name']
+        command_args = match['ctx_args'].strip()
+        
+        # Check if this command exists in the registry
+        command = command_registry.get(potential_command)
+        if command and getattr(command, 'is_context_provider', False):
+            # This is a Context Provider Command - expand inline and use with the LLM
+            try:
+                context = {
+                    'current_model': model,
+                    'messages': [],
+                    'cli_settings': cli_settings
+                }
+                # Parse command arguments
+                args = [f"{potential_command}:"] + command_args.split() if command_args else [f"{potential_command}:"]
+                context_result = command_registry.execute_command(potential_command, args, context)
+
+                if context_result and not context_result.startswith("❌"):
+                    # Build a prompt that includes the produced context and a default instruction
+                    visible_context_output = (
+                        f"=== Context from {potential_command}: ===\n{context_result}\n=== End Context ==="
+                    )
+                    cp_enhanced_prompt = (
+                        f"{visible_context_output}\n\n---\n\n"
+                        f"User question: Odpowiedz, uwzględniając powyższy kontekst."
+                    )
+                else:
+                    yield f"❌ No result from {potential_command}: command"
+                    return
+            except Exception as e:
+                yield f"❌ Error executing {potential_command}: command: {e}"
+                return
     
     # Process content in user message (URLs, file paths) with inline Context Provider expansion
     enhanced_prompt = cp_enhanced_prompt
 
     # Detect and expand inline Context Provider commands inside the prompt, e.g. "... folder: ."
     try:
-        available_commands = command_registry.list_commands()
         # Only handle the first inline context provider to keep parsing simple
-        for cmd_name in available_commands:
-            cmd = command_registry.get_command(cmd_name)
+        for cmd_name in command_registry.command_names():
+            cmd = command_registry.get(cmd_name)
             if not (cmd and getattr(cmd, 'is_context_provider', False)):
                 continue
             label = f"{cmd_name}:"
@@ -161,7 +287,7 @@ def execute_prompt(prompt: str, model: str, use_local: bool = True) -> str:
             consumed = len(after) - len(after_stripped)
             cmd_arg = ""
             end_pos = idx + len(label) + consumed
-            if after_stripped.startswith('"') or after_stripped.startswith("'"):
+            if after_stripped.startswith(('"', "'")):
                 q = after_stripped[0]
                 # Find closing quote
                 end_q = after_stripped.find(q, 1)
@@ -208,117 +334,158 @@ def execute_prompt(prompt: str, model: str, use_local: bool = True) -> str:
         enhanced_prompt = None
 
     if enhanced_prompt is None:
+        if content_processor is None:
+            content_processor = _content_processor()
         enhanced_prompt = content_processor.process_content_in_text(prompt)
     
     # For AI model queries, check if llama-cpp-python is available
-    if not HAS_LLAMA_CPP:
-        return "[LOCAL MODEL ERROR] llama-cpp-python not installed. Install with: conda install -c conda-forge llama-cpp-python"
+    hf_models = _hf_models()
+    if not hf_models.HAS_LLAMA_CPP:
+        yield "[LOCAL MODEL ERROR] llama-cpp-python not installed. Install with: conda install -c conda-forge llama-cpp-python"
+        return
     
     # Check if model is downloaded
+    if hf_model_manager is None:
+        hf_model_manager = hf_models.get_model_manager()
     if not hf_model_manager.is_model_downloaded(model):
-        return f"[LOCAL MODEL ERROR] Model {model} not downloaded. Use :download {model}"
-    
-    # Prepare system prompt with dynamic assistant name for AI model
-    assistant_name = cli_settings.get_assistant_name()
-    system_prompt = (f"You are {assistant_name}, a helpful Polish AI assistant. "
-                     f"Respond in Polish unless asked otherwise.")
+        yield f"[LOCAL MODEL ERROR] Model {model} not downloaded. Use :download {model}"
+        return
     
     # Create messages for AI model
     messages = [
-        {"role": "system", "content": system_prompt},
+        {"role": "system", "content": _system_prompt(cli_settings)},
         {"role": "user", "content": enhanced_prompt}
     ]
     
-    # Send to local HF model
-    model_response = send_chat(messages, model=model, use_local=True)
+    # Stream the local HF model's answer, preceded by any visible context
     if visible_context_output:
-        return f"{visible_context_output}\n\n{model_response}"
-    return model_response
+        yield f"{visible_context_output}\n\n"
+    yield from _chat_api().send_chat_stream(messages, model=model)
+
+
+def execute_prompt(prompt: str, model: str, use_local: bool = True, **components) -> str:
+    """
+    Execute a single prompt and return the complete output.
+
+    Takes the same arguments as stream_prompt(), whose chunks it joins.
+    """
+    return "".join(stream_prompt(prompt, model, use_local, **components))
+
+
+# Banner rules used by the CLI output
+_DIVIDER = "─" * 53
+_EQUALS = "=" * 50
+
+# ANSI erase-line + carriage return, used to replace the "thinking..." status
+_CLEAR_LINE = "\x1b[2K\r"
+
+# A --test-model case; keywords are stored lowercased for matching and as
+# written for display
+ModelTestCase = namedtuple(
+    "ModelTestCase", "name prompt expected_keywords_lower expected_keywords_display"
+)
+
+
+def _model_test_case(name: str, prompt: str, keywords: tuple) -> ModelTestCase:
+    """Build a ModelTestCase, lowercasing its keywords once."""
+    return ModelTestCase(name, prompt, tuple(kw.lower() for kw in keywords), keywords)
+
+
+# Prompts and accepted keywords for --test-model
+_TEST_CASES = (
+    _model_test_case("Basic Math", "Ile jest 2 + 2?",
+                     ("4", "cztery")),
+    _model_test_case("Polish Language", "Napisz krótkie zdanie po polsku o pogodzie",
+                     ("pogoda", "słońce", "deszcz", "chmury", "temperatura")),
+    _model_test_case("Simple Question", "Co to jest sztuczna inteligencja?",
+                     ("AI", "inteligencja", "komputer", "algorytm", "uczenie")),
+    _model_test_case("Creative Writing", "Napisz krótką historyjkę o kocie",
+                     ("kot", "miau", "łapy", "ogon")),
+    _model_test_case("Code Generation", "Napisz prostą funkcję Python, która dodaje dwie liczby",
+                     ("def", "return", "+", "python")),
+)
 
 
-def run_model_tests(model: str, use_local: bool = False) -> None:
-    """Run a series of tests on the specified model."""
+def run_model_tests(model: str, use_local: bool = False, fail_fast: bool = False) -> None:
+    """
+    Run a series of tests on the specified model.
+    
+    Progress is flushed after every line so CI logs show it as it happens.
+    
+    Args:
+        model: Model name to test
+        use_local: Kept for compatibility; tests always use the local model
+        fail_fast: Stop after the first failing test
+    """
     print(f"🧪 Running model tests for: {model}")
-    print("=" * 50)
-    
-    test_cases = [
-        {
-            "name": "Basic Math",
-            "prompt": "Ile jest 2 + 2?",
-            "expected_keywords": ["4", "cztery"]
-        },
-        {
-            "name": "Polish Language",
-            "prompt": "Napisz krótkie zdanie po polsku o pogodzie",
-            "expected_keywords": ["pogoda", "słońce", "deszcz", "chmury", "temperatura"]
-        },
-        {
-            "name": "Simple Question",
-            "prompt": "Co to jest sztuczna inteligencja?",
-            "expected_keywords": ["AI", "inteligencja", "komputer", "algorytm", "uczenie"]
-        },
-        {
-            "name": "Creative Writing",
-            "prompt": "Napisz krótką historyjkę o kocie",
-            "expected_keywords": ["kot", "miau", "łapy", "ogon"]
-        },
-        {
-            "name": "Code Generation",
-            "prompt": "Napisz prostą funkcję Python, która dodaje dwie liczby",
-            "expected_keywords": ["def", "return", "+", "python"]
-        }
-    ]
+    print(_EQUALS, flush=True)
     
     results = []
     
-    for i, test in enumerate(test_cases, 1):
-        print("\n🧪 Test " + str(i) + "/5: " + test['name'])
-        print("📝 Prompt: " + test['prompt'])
+    for i, test in enumerate(_TEST_CASES, 1):
+        print(f"\n🧪 Test {i}/{len(_TEST_CASES)}: {test.name}")
+        print(f"📝 Prompt: {test.prompt}", flush=True)
         
+        start_time = time.perf_counter()
         try:
-            response = execute_prompt(test['prompt'], model, use_local)
+            response = execute_prompt(test.prompt, model, use_local)
+            elapsed_s = time.perf_counter() - start_time
             print(f"🤖 Response: {response[:100]}...")
             
             # Check if response contains expected keywords
             response_lower = response.lower()
-            found_keywords = [kw for kw in test['expected_keywords'] 
-                            if kw.lower() in response_lower]
+            found_keywords = [kw for kw, lkw in zip(test.expected_keywords_display,
+                                                    test.expected_keywords_lower)
+                              if lkw in response_lower]
             
             success = len(found_keywords) > 0
             results.append({
-                'test': test['name'],
+                'test': test.name,
                 'success': success,
                 'keywords_found': found_keywords,
-                'response_length': len(response)
+                'response_length': len(response),
+                'elapsed_s': elapsed_s
             })
             
             status = "✅ PASS" if success else "❌ FAIL"
-            print(f"📊 Status: {status} (Found: {', '.join(found_keywords)})")
+            print(f"📊 Status: {status} (Found: {', '.join(found_keywords)}) in {elapsed_s:.2f}s",
+                  flush=True)
             
         except Exception as e:
-            print(f"❌ ERROR: {str(e)}")
+            success = False
+            print(f"❌ ERROR: {str(e)}", flush=True)
             results.append({
-                'test': test['name'],
+                'test': test.name,
                 'success': False,
-                'error': str(e)
+                'error': str(e),
+                'elapsed_s': time.perf_counter() - start_time
             })
+        
+        if fail_fast and not success:
+            print("⚠️  fail-fast: stopping after first failure", flush=True)
+            break
     
     # Summary
-    print("\n" + "="*50)
-    print("📊 TEST SUMMARY")
-    print("="*50)
-    
     passed = sum(1 for r in results if r['success'])
     total = len(results)
-    
-    print("✅ Passed: " + str(passed) + "/" + str(total))
-    print("❌ Failed: " + str(total - passed) + "/" + str(total))
-    print("📈 Success Rate: " + str(round((passed/total)*100, 1)) + "%")
+    success_rate = round(passed * 100 / total, 1) if total else 0.0
     
     if passed == total:
-        print("\n🎉 All tests passed! Model " + model + " is working correctly.")
+        verdict = f"\n🎉 All tests passed! Model {model} is working correctly."
     else:
-        print("\n⚠️  Some tests failed. Check model configuration or connectivity.")
+        verdict = "\n⚠️  Some tests failed. Check model configuration or connectivity."
+    
+    timings = [f"   ⏱️  {r['test']}: {r['elapsed_s']:.2f}s" for r in results]
+    print("\n".join([
+        f"\n{_EQUALS}",
+        "📊 TEST SUMMARY",
+        _EQUALS,
+        f"✅ Passed: {passed}/{total}",
+        f"❌ Failed: {total - passed}/{total}",
+        f"📈 Success Rate: {success_rate}%",
+        *timings,
+        verdict,
+    ]), flush=True)
 
 
 def parse_args():
@@ -339,6 +506,7 @@ Usage Examples:
   bielik --prompt "test" --model bielik-7b     # Execute prompt with HF model (long form)
   bielik --test-model                           # Run model performance tests
   bielik --test-model -m bielik-4.5b-v3.0      # Test specific HF model
+  bielik --test-model --fail-fast              # Stop model tests at first failure
 
 Powered by HuggingFace + SpeakLeash - Local AI models for everyone!
         """
@@ -387,138 +555,166 @@ Powered by HuggingFace + SpeakLeash - Local AI models for everyone!
         help="Run model tests and exit"
     )
     
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="With --test-model, stop at the first failing test"
+    )
+    
     return parser.parse_args()
 
 
-def main():
-    """Main entry point for Bielik CLI."""
-    args = parse_args()
-    
-    # Initialize components
-    config = get_config()
-    logger = get_logger(__name__)
-    content_processor = get_content_processor()
-    command_processor = CommandProcessor()
-    setup_manager = SetupManager()
-    hf_model_manager = get_model_manager()
-    cli_settings = get_cli_settings()
+@dataclass(frozen=True)
+class RuntimeCfg:
+    """CLI options resolved once at startup from arguments, config and .env."""
+    model: str
+    use_local: bool  # --use-local or --local-model given explicitly
+    prompt: Optional[str]
+    test_model: bool
+    setup: bool
+    no_setup: bool
+    fail_fast: bool
+    preload: bool  # Load the chat model in the background at startup
+
+
+def resolve_runtime_config(args, config, cli_settings) -> RuntimeCfg:
+    """
+    Resolve the model to use and the run mode from parsed arguments.
     
+    Args:
+        args: Namespace returned by parse_args()
+        config: BielikConfig instance
+        cli_settings: CLISettingsManager instance
+        
+    Returns:
+        RuntimeCfg with the selected model and mode flags
+    """
     # Smart model selection with .env fallback
-    current_model = args.model
-    use_local_model = args.use_local
+    model = args.model
     
     # Load last used model from .env if no model specified via CLI
-    if current_model == config.BIELIK_MODEL:  # Default model from config
+    if model == config.BIELIK_MODEL:  # Default model from config
         env_model = cli_settings.get_current_model()
         if env_model and env_model != config.BIELIK_MODEL:
-            current_model = env_model
-            logger.info(f"Loaded last used model from .env: {current_model}")
+            model = env_model
+            get_logger(__name__).info(f"Loaded last used model from .env: {model}")
     
     # Handle local model specification
     if args.local_model:
-        current_model = args.local_model
-        use_local_model = True
+        model = args.local_model
+    
+    return RuntimeCfg(
+        model=model,
+        use_local=args.use_local or bool(args.local_model),
+        prompt=args.prompt,
+        test_model=args.test_model,
+        setup=args.setup,
+        no_setup=args.no_setup,
+        fail_fast=args.fail_fast,
+        preload=config.MODEL_PRELOAD,
+    )
+
+
+def main():
+    """Main entry point for Bielik CLI."""
+    cli_settings = get_cli_settings()
+    cfg = resolve_runtime_config(parse_args(), get_config(), cli_settings)
+    current_model = cfg.model
+    use_local_model = cfg.use_local
+
+    # Plain CLI commands passed with --prompt never touch a model, so the
+    # HF model layer is only loaded when something will actually use it
+    will_use_model = not cfg.prompt or _prompt_uses_model(cfg.prompt)
+    hf_model_manager = _hf_models().get_model_manager() if will_use_model else None
     
     # Validate model availability and set fallback logic
-    model_available = validate_model_availability(current_model, hf_model_manager)
+    model_available = not will_use_model or validate_model_availability(current_model, hf_model_manager)
     if not model_available:
         # Try to find a working fallback model
         fallback_model = find_fallback_model(hf_model_manager)
         if fallback_model:
             print(f"⚠️  Model '{current_model}' not available, using fallback: {fallback_model}")
             current_model = fallback_model
-            if current_model in hf_model_manager.SPEAKLEASH_MODELS:
+            if current_model in hf_model_manager.SPEAKLEASH_MODELS_SET:
                 use_local_model = True
         else:
             print(f"❌ No working models available. Please check your configuration.")
-            if not args.prompt and not args.test_model:
+            if not cfg.prompt and not cfg.test_model:
                 print("💡 Try: bielik --setup")
                 sys.exit(1)
     
     # Handle non-interactive modes
-    if args.prompt:
+    if cfg.prompt:
         # Execute single prompt and exit
         try:
-            # Decide if this prompt will actually use the model
-            will_use_model = True
-            p = args.prompt.strip()
-            if ":" in p and not p.startswith("http"):
-                # Check against dynamic command registry to detect CLI/context provider
-                try:
-                    from .command_api import get_command_registry
-                    registry = get_command_registry()
-                    if p.startswith(":"):
-                        parts = p[1:].split(" ", 1)
-                        cmd_name = parts[0].strip()
-                        if cmd_name in registry.list_commands():
-                            cmd = registry.get_command(cmd_name)
-                            # Direct CLI command → no model required
-                            if cmd and not getattr(cmd, "is_context_provider", False):
-                                will_use_model = False
-                    else:
-                        name = p.split(":", 1)[0].strip()
-                        if name in registry.list_commands():
-                            # Context Provider command → we WILL use model with inline-expanded context
-                            will_use_model = True
-                except Exception:
-                    # If detection fails, keep default behavior
-                    pass
-
             if will_use_model:
                 print(f"🤖 Using model: {current_model}")
 
-            response = execute_prompt(args.prompt, current_model, use_local_model)
-            print(response)
+            # Write the answer as it is generated instead of after the last token
+            for chunk in stream_prompt(cfg.prompt, current_model, use_local_model,
+                                       hf_model_manager=hf_model_manager,
+                                       cli_settings=cli_settings):
+                sys.stdout.write(chunk)
+                sys.stdout.flush()
+            sys.stdout.write("\n")
             return
         except Exception as e:
             print(f"❌ Error executing prompt: {str(e)}")
             sys.exit(1)
     
-    if args.test_model:
+    if cfg.test_model:
         # Run model tests and exit
         try:
-            run_model_tests(current_model, use_local_model)
+            run_model_tests(current_model, use_local_model, fail_fast=cfg.fail_fast)
             return
         except Exception as e:
             print(f"❌ Error running tests: {str(e)}")
             sys.exit(1)
     
     
-    # Show welcome message
-    command_processor.show_welcome()
+    from .commands import CommandProcessor
+    command_processor = CommandProcessor()
+    content_processor = _content_processor()
+
+    # Collect the welcome banner and startup status, then write them at once
+    startup_lines = [command_processor.get_welcome_text()]
     
     # Force setup if requested (for HF model downloads)
-    if args.setup:
-        print("🔧 Running HF model configuration...")
-        print("💡 Use ':download <model>' to download HuggingFace models")
-        print("💡 Available models: bielik-7b-instruct, bielik-4.5b-v3.0-instruct")
-        print()
+    if cfg.setup:
+        startup_lines += [
+            "🔧 Running HF model configuration...",
+            "💡 Use ':download <model>' to download HuggingFace models",
+            "💡 Available models: bielik-7b-instruct, bielik-4.5b-v3.0-instruct",
+            "",
+        ]
     
     # Check local HF model availability
-    if not args.no_setup:
+    if not cfg.no_setup:
         # Simple check for llama-cpp-python and downloaded models
-        from ..hf_models import HAS_LLAMA_CPP
-        
-        if not HAS_LLAMA_CPP:
-            print("❌ llama-cpp-python not installed")
-            print("💡 Install with: conda install -c conda-forge llama-cpp-python")
-            print()
+        if not _hf_models().HAS_LLAMA_CPP:
+            startup_lines += [
+                "❌ llama-cpp-python not installed",
+                "💡 Install with: conda install -c conda-forge llama-cpp-python",
+                "",
+            ]
         elif not hf_model_manager.is_model_downloaded(current_model):
-            print(f"❌ Model '{current_model}' not downloaded locally")
-            print(f"💡 Download with: :download {current_model}")
-            print()
+            startup_lines += [
+                f"❌ Model '{current_model}' not downloaded locally",
+                f"💡 Download with: :download {current_model}",
+                "",
+            ]
         else:
-            print("✅ Local HF model ready")
-            print()
+            startup_lines += ["✅ Local HF model ready", ""]
+            # Load the model while the user types the first message
+            if cfg.preload:
+                _chat_api().get_chat_communicator().preload(current_model)
 
-    print("🚀 Ready to chat! Write something...")
-    print("─" * 53)
+    startup_lines += ["🚀 Ready to chat! Write something...", _DIVIDER]
+    sys.stdout.write("\n".join(startup_lines) + "\n")
+    sys.stdout.flush()
 
     # Initialize conversation with dynamic assistant name
-    assistant_name = cli_settings.get_assistant_name()
-    system_prompt = (f"You are {assistant_name}, a helpful Polish AI assistant. "
-                     f"Respond in Polish unless asked otherwise.")
-    messages = [{"role": "system", "content": system_prompt}]
+    messages = [{"role": "system", "content": _system_prompt(cli_settings)}]
     
     # Initialize context storage for Context Provider commands
     current_context = None
@@ -532,9 +728,9 @@ def main():
         while True:
             try:
                 user_prompt = cli_settings.get_user_prompt_prefix()
-                user_input = input("\n" + user_prompt + " ").strip()
+                user_input = input(f"\n{user_prompt} ").strip()
             except EOFError:
-                print("\n👋 Goodbye " + cli_settings.get_user_name() + "!")
+                print(f"\n👋 Goodbye {cli_settings.get_user_name()}!")
                 break
 
             if not user_input:
@@ -542,32 +738,27 @@ def main():
 
             # Handle special commands
             if command_processor.is_command(user_input):
-                continue_chat, result_data, updated_messages = command_processor.process_command(
-                    user_input, messages, current_model
-                )
+                result = command_processor.process_command(user_input, messages, current_model)
                 
-                if not continue_chat:
+                if not result.continue_chat:
                     break
                 
-                # Check if this is a Context Provider command (result_data is context string)
-                if isinstance(result_data, str) and result_data.strip():
+                messages = result.messages
+                
+                if result.kind == "context":
                     # Store context from Context Provider command (replaces previous context)
-                    current_context = result_data
+                    current_context = result.context
                     print("✅ Context loaded! You can now ask questions about the provided data.")
                     print("💡 Tip: Use another Context Provider command to load new context, or continue chatting.")
-                    messages = updated_messages
-                    continue
                 
-                # Handle model switching for direct commands (result_data is new_model)
-                if result_data is not None and not isinstance(result_data, str):
-                    current_model = result_data
+                elif result.kind == "switch_model":
+                    current_model = result.model
                     # If switching to local model, enable local mode
-                    if current_model in hf_model_manager.SPEAKLEASH_MODELS:
+                    if current_model in hf_model_manager.SPEAKLEASH_MODELS_SET:
                         use_local_model = True
                     else:
-                        use_local_model = args.use_local or (args.local_model is not None)
+                        use_local_model = cfg.use_local
                 
-                messages = updated_messages
                 continue
 
             # Process content in user message (URLs, file paths)
@@ -581,14 +772,22 @@ def main():
             assistant_prompt = cli_settings.get_assistant_prompt_prefix()
             print(f"{assistant_prompt} thinking...", end="", flush=True)
 
-            # Send message to model
-            response = send_chat(messages, model=current_model, use_local=use_local_model)
-            print(f"\r{assistant_prompt} " + " "*20)  # Clear "thinking" message
-            print(f"    {response}")
+            # Stream the response to the terminal as it is generated; the
+            # "thinking" message stays up until the first chunk arrives and is
+            # then erased, or just ended with a newline when output is redirected
+            clear_line = _CLEAR_LINE if sys.stdout.isatty() else "\n"
+            chunks = []
+            for chunk in _chat_api().send_chat_stream(messages, model=current_model):
+                if not chunks:
+                    sys.stdout.write(f"{clear_line}{assistant_prompt}\n    ")
+                sys.stdout.write(chunk)
+                sys.stdout.flush()  # Defeat line buffering when stdout is a pipe
+                chunks.append(chunk)
+            sys.stdout.write("\n" if chunks else f"{clear_line}{assistant_prompt}\n")
+            response = "".join(chunks)
 
             # Only add to history if it's a real response, not an error
-            error_prefixes = ["[ERROR]", "[REST ERROR]", "[OLLAMA LIB ERROR]", "[LOCAL MODEL ERROR]"]
-            if not any(response.startswith(prefix) for prefix in error_prefixes):
+            if not response.startswith(ERROR_PREFIXES):
                 messages.append({"role": "assistant", "content": response})
 
     except KeyboardInterrupt:
@@ -6,10 +6,11 @@ This module provides CLI commands for downloading, managing, and switching
 between SpeakLeash models from Hugging Face.
 """
 
+import sys
 from typing import Dict, Any
 from pathlib import Path
 
-from ..hf_models import get_model_manager, HAS_LLAMA_CPP
+from ..hf_models import get_model_manager, HAS_LLAMA_CPP, SPEAKLEASH_MODELS_SET
 from ..config import get_config, get_logger
 
 
@@ -23,34 +24,37 @@ class ModelManager:
     
     def show_models(self) -> None:
         """Display available and downloaded Hugging Face models."""
-        print("\n🤗 Hugging Face Models - SpeakLeash:")
-        print("=" * 50)
+        # Build the whole listing first and write it in one call
+        out = ["\n🤗 Hugging Face Models - SpeakLeash:\n", "=" * 50, "\n"]
         
         # Show available models
         available = self.model_manager.list_available_models()
-        print("📋 Available Models:")
+        out.append("📋 Available Models:\n")
         for model_info in available:
             model_name = model_info['name']
             status = "✅ Downloaded" if self.model_manager.is_model_downloaded(model_name) else "⬇️ Available for download"
-            print(f"  {model_name}")
-            print(f"    📝 {model_info['description']}")
-            print(f"    📊 Parameters: {model_info['parameters']}")
-            print(f"    📈 Status: {status}")
-            print()
+            out.append(
+                f"  {model_name}\n"
+                f"    📝 {model_info['description']}\n"
+                f"    📊 Parameters: {model_info['parameters']}\n"
+                f"    📈 Status: {status}\n\n"
+            )
         
         # Show downloaded models
         downloaded = self.model_manager.list_downloaded_models()
         if downloaded:
-            print("💾 Downloaded Models:")
+            out.append("💾 Downloaded Models:\n")
             for model_name, info in downloaded.items():
                 size_gb = info.size_bytes / (1024**3)
-                print(f"  {model_name} ({size_gb:.1f} GB)")
-                print(f"    📁 Path: {info.local_path}")
-            print()
+                out.append(f"  {model_name} ({size_gb:.1f} GB)\n    📁 Path: {info.local_path}\n")
+            out.append("\n")
+        
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
     
     def download_model(self, model_name: str) -> bool:
         """Download a Hugging Face model and return success status."""
-        if model_name not in self.model_manager.SPEAKLEASH_MODELS:
+        if model_name not in SPEAKLEASH_MODELS_SET:
             print(f"❌ Unknown model: {model_name}")
             print("💡 Use :models to see available models")
             return False
@@ -91,9 +95,9 @@ class ModelManager:
             return
         
         # Get model info for confirmation
-        downloaded = self.model_manager.list_downloaded_models()
-        if model_name in downloaded:
-            size_gb = downloaded[model_name].get('size_bytes', 0) / (1024**3)
+        model_info = self.model_manager.get_model_info(model_name)
+        if model_info:
+            size_gb = model_info.size_bytes / (1024**3)
             print(f"🗑️  Are you sure you want to delete model {model_name} ({size_gb:.1f} GB)?")
             try:
                 confirm = input("Confirm deletion (y/N): ").lower()
@@ -104,6 +108,10 @@ class ModelManager:
                 print("\n❌ Deletion cancelled")
                 return
         
+        # Unload the model first so its memory-mapped weights do not pin the file
+        from .send_chat import get_chat_communicator
+        get_chat_communicator().clear_model_cache(model_name)
+        
         try:
             if self.model_manager.delete_model(model_name):
                 print(f"✅ Model {model_name} deleted successfully")
@@ -115,23 +123,28 @@ class ModelManager:
     
     def show_storage_stats(self) -> None:
         """Show storage statistics for HF models."""
-        print("\n💾 Storage Statistics:")
-        print("=" * 30)
+        out = ["\n💾 Storage Statistics:\n", "=" * 30, "\n"]
         
         try:
             stats = self.model_manager.get_storage_stats()
-            print(f"📊 Downloaded models: {stats['downloaded_count']}")
-            print(f"💽 Total size: {stats['total_size_gb']:.1f} GB")
-            print(f"📁 Models directory: {stats['models_dir']}")
+            out.append(
+                f"📊 Downloaded models: {stats['total_models']}\n"
+                f"💽 Total size: {stats['total_size_gb']:.1f} GB\n"
+                f"📁 Models directory: {stats['models_directory']}\n"
+                f"🤗 Hugging Face cache: {stats['hub_cache_directory']}\n"
+            )
             
             if stats['models']:
-                print("\n📋 Model Details:")
+                out.append("\n📋 Model Details:\n")
                 for model_name, info in stats['models'].items():
                     size_gb = info['size_bytes'] / (1024**3)
-                    print(f"  {model_name}: {size_gb:.1f} GB")
+                    out.append(f"  {model_name}: {size_gb:.1f} GB\n")
         except Exception as e:
             self.logger.error(f"Error getting storage stats: {e}")
-            print(f"❌ Error retrieving statistics: {e}")
+            out.append(f"❌ Error retrieving statistics: {e}\n")
+        
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
     
     def switch_model(self, model_name: str, current_model: str) -> str:
         """
@@ -145,7 +158,7 @@ class ModelManager:
             New model name to use
         """
         # Check if it's an HF model
-        if model_name in self.model_manager.SPEAKLEASH_MODELS:
+        if model_name in SPEAKLEASH_MODELS_SET:
             if not self.model_manager.is_model_downloaded(model_name):
                 print(f"❌ Model {model_name} is not downloaded")
                 print(f"💡 Use :download {model_name} to download it")
@@ -171,7 +184,7 @@ class ModelManager:
         """Get information about a specific model."""
         info = {
             "model_name": model_name,
-            "is_hf_model": model_name in self.model_manager.SPEAKLEASH_MODELS,
+            "is_hf_model": model_name in SPEAKLEASH_MODELS_SET,
             "is_downloaded": False,
             "has_llama_cpp": HAS_LLAMA_CPP
         }
@@ -179,9 +192,8 @@ class ModelManager:
         if info["is_hf_model"]:
             info["is_downloaded"] = self.model_manager.is_model_downloaded(model_name)
             if info["is_downloaded"]:
-                downloaded = self.model_manager.list_downloaded_models()
-                if model_name in downloaded:
-                    model_info = downloaded[model_name]
+                model_info = self.model_manager.get_model_info(model_name)
+                if model_info:
                     info.update({
                         "local_path": model_info.local_path,
                         "size_gb": model_info.size_bytes / (1024**3),
@@ -205,7 +217,7 @@ class ModelManager:
             Full model name for usage in chat
         """
         # For HF models, return as-is
-        if model_name in self.model_manager.SPEAKLEASH_MODELS:
+        if model_name in SPEAKLEASH_MODELS_SET:
             return model_name
         
         # For Ollama models, assume the name is already correct
@@ -6,10 +6,16 @@ This module provides the communication layer between the CLI and local
 HuggingFace models using llama-cpp-python.
 """
 
-from typing import List, Dict, Optional
+import asyncio
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, List, Dict, Iterator, Optional, Tuple
 
+from .._compat import HAS_LLAMA_CPP, hf_models as _hf_models
 from ..config import get_config, get_logger
-from ..hf_models import get_model_manager, LocalLlamaRunner, HAS_LLAMA_CPP
+
+if TYPE_CHECKING:
+    from ..models.local_runner import LocalLlamaRunner
 
 
 class ChatCommunicator:
@@ -18,9 +24,20 @@ class ChatCommunicator:
     def __init__(self):
         self.config = get_config()
         self.logger = get_logger(__name__)
-        self.model_manager = get_model_manager()
-        self._model_cache = {}  # Cache for loaded models: {model_path: LocalLlamaRunner}
+        self._model_manager = None
+        # LRU cache of loaded models: {model_name: LocalLlamaRunner}, most recent last
+        self._model_cache: "OrderedDict[str, LocalLlamaRunner]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # Per-model locks held while a model loads: {model_name: Lock}
+        self._load_locks: Dict[str, threading.Lock] = {}
         
+    @property
+    def model_manager(self):
+        """SpeakLeash model manager, created on first use."""
+        if self._model_manager is None:
+            self._model_manager = _hf_models().get_model_manager()
+        return self._model_manager
+    
     def send_chat(self, messages: List[Dict], model: str = None, use_local: bool = True) -> str:
         """
         Send chat messages to local HF model.
@@ -36,37 +53,204 @@ class ChatCommunicator:
         if model is None:
             model = self.config.BIELIK_MODEL
         
-        # Check if llama-cpp-python is available
+        runner, error = self._get_runner(model)
+        if runner is None:
+            return error
+        
+        try:
+            response = runner.chat(messages)
+            self.logger.info(f"Local HF model response received for {model}")
+            return response
+            
+        except Exception as e:
+            self.logger.error(f"Local HF model failed for {model}: {e}")
+            return f"[LOCAL MODEL ERROR] {e}"
+    
+    def send_chat_batch(self, conversations: List[List[Dict]], model: str = None) -> List[str]:
+        """
+        Send several independent conversations to one model.
+        
+        The model is resolved and loaded once for the whole batch and each
+        conversation is generated back to back on it.
+        
+        Args:
+            conversations: List of message lists, one per conversation
+            model: Model name to use
+            
+        Returns:
+            Responses in the same order as conversations
+        """
+        if model is None:
+            model = self.config.BIELIK_MODEL
+        
+        runner, error = self._get_runner(model)
+        if runner is None:
+            return [error] * len(conversations)
+        
+        responses = []
+        for messages in conversations:
+            try:
+                responses.append(runner.chat(messages))
+            except Exception as e:
+                self.logger.error(f"Local HF model failed for {model}: {e}")
+                responses.append(f"[LOCAL MODEL ERROR] {e}")
+        
+        self.logger.info(f"Local HF model batch of {len(conversations)} finished for {model}")
+        return responses
+    
+    async def send_chat_async(self, messages: List[Dict], model: str = None) -> str:
+        """
+        Send chat messages without blocking the event loop.
+        
+        Generation runs in a worker thread. Requests for the same model are
+        serialized by the runner; different models can generate concurrently.
+        
+        Args:
+            messages: List of message dictionaries
+            model: Model name to use
+            
+        Returns:
+            Assistant's response content
+        """
+        return await asyncio.to_thread(self.send_chat, messages, model)
+    
+    async def send_chat_many(self, conversations: List[List[Dict]], model: str = None) -> List[str]:
+        """
+        Send several independent conversations concurrently.
+        
+        Args:
+            conversations: List of message lists, one per conversation
+            model: Model name to use
+            
+        Returns:
+            Responses in the same order as conversations
+        """
+        return list(await asyncio.gather(
+            *(self.send_chat_async(messages, model) for messages in conversations)
+        ))
+    
+    def send_chat_stream(self, messages: List[Dict], model: str = None) -> Iterator[str]:
+        """
+        Send chat messages to local HF model and yield the response as it is generated.
+        
+        Args:
+            messages: List of message dictionaries
+            model: Model name to use
+            
+        Yields:
+            Response text chunks; errors are yielded as a single "[LOCAL MODEL ERROR] ..." chunk
+        """
+        if model is None:
+            model = self.config.BIELIK_MODEL
+        
+        runner, error = self._get_runner(model)
+        if runner is None:
+            yield error
+            return
+        
+        try:
+            yield from runner.chat_stream(messages)
+            self.logger.info(f"Local HF model stream finished for {model}")
+        except Exception as e:
+            self.logger.error(f"Local HF model failed for {model}: {e}")
+            yield f"[LOCAL MODEL ERROR] {e}"
+    
+    def preload(self, model: str = None) -> Optional[threading.Thread]:
+        """
+        Start loading a model into the cache in a background thread.
+        
+        A chat request for the same model that arrives before loading has
+        finished waits on that model's load lock instead of loading it twice;
+        other cached models stay available. The load is bounded by the usual
+        model loading timeout (BIELIK_LOAD_TIMEOUT).
+        
+        Args:
+            model: Model name to load
+            
+        Returns:
+            The daemon thread doing the load, or None if llama-cpp is unavailable
+        """
         if not HAS_LLAMA_CPP:
-            return "[LOCAL MODEL ERROR] llama-cpp-python not installed. Install with: conda install -c conda-forge llama-cpp-python"
+            return None
+        if model is None:
+            model = self.config.BIELIK_MODEL
         
-        # Check if model is downloaded
-        if not self.model_manager.is_model_downloaded(model):
-            return f"[LOCAL MODEL ERROR] Model {model} not downloaded. Use :download {model}"
+        def _load():
+            runner, error = self._get_runner(model)
+            if runner is None:
+                self.logger.info(f"Preloading {model} skipped: {error}")
+        
+        thread = threading.Thread(target=_load, name=f"preload-{model}", daemon=True)
+        thread.start()
+        return thread
+    
+    def _get_runner(self, model: str) -> Tuple[Optional["LocalLlamaRunner"], Optional[str]]:
+        """
+        Get a loaded runner for the model, loading it into the cache on first use.
+        
+        Returns:
+            Tuple of (runner, None) on success or (None, error_message) on failure
+        """
+        # Check if llama-cpp-python is available
+        if not HAS_LLAMA_CPP:
+            return None, "[LOCAL MODEL ERROR] llama-cpp-python not installed. Install with: conda install -c conda-forge llama-cpp-python"
         
         try:
-            # Get model path
-            model_path = self.model_manager.get_model_path(model)
-            if not model_path:
-                return f"[LOCAL MODEL ERROR] Model {model} path not found"
+            runner = self._cached_runner(model)
+            if runner is not None:
+                return runner, None
             
-            # Check if model is already loaded in cache
-            if model_path in self._model_cache:
-                self.logger.debug(f"Using cached model: {model}")
-                runner = self._model_cache[model_path]
-            else:
-                # Initialize local runner and cache it
+            # Loads of the same model are serialized; other models keep being
+            # served from the cache while this one loads
+            with self._cache_lock:
+                load_lock = self._load_locks.setdefault(model, threading.Lock())
+            
+            with load_lock:
+                # Another thread may have finished loading it while we waited
+                runner = self._cached_runner(model)
+                if runner is not None:
+                    return runner, None
+                
+                # Only a cache miss needs the model's location on disk
+                model_path = self.model_manager.resolve_downloaded(model)
+                if not model_path:
+                    return None, f"[LOCAL MODEL ERROR] Model {model} not downloaded. Use :download {model}"
+                
                 self.logger.info(f"Loading model into cache: {model}")
-                runner = LocalLlamaRunner(model_path)
-                self._model_cache[model_path] = runner
+                runner = self._load_runner(model_path)
+                
+                # Cache it, evicting the least recently used
+                evicted = []
+                with self._cache_lock:
+                    self._model_cache[model] = runner
+                    max_models = max(1, self.config.MODEL_CACHE_SIZE)
+                    while len(self._model_cache) > max_models:
+                        evicted.append(self._model_cache.popitem(last=False))
             
-            response = runner.chat(messages)
-            self.logger.info(f"Local HF model response received for {model}")
-            return response
+            # close() waits for a generation still running on the evicted
+            # runner, so it is called without holding any cache lock
+            for evicted_model, evicted_runner in evicted:
+                self.logger.info(f"Evicting cached model: {evicted_model}")
+                evicted_runner.close()
+            
+            return runner, None
             
         except Exception as e:
             self.logger.error(f"Local HF model failed for {model}: {e}")
-            return f"[LOCAL MODEL ERROR] {e}"
+            return None, f"[LOCAL MODEL ERROR] {e}"
+    
+    def _cached_runner(self, model: str) -> Optional["LocalLlamaRunner"]:
+        """Return the cached runner for the model, marking it most recently used."""
+        with self._cache_lock:
+            runner = self._model_cache.get(model)
+            if runner is not None:
+                self.logger.debug(f"Using cached model: {model}")
+                self._model_cache.move_to_end(model)
+            return runner
+    
+    def _load_runner(self, model_path: str) -> "LocalLlamaRunner":
+        """Load a model from disk; called without the cache lock held."""
+        return _hf_models().LocalLlamaRunner(model_path)
     
     def clear_model_cache(self, model: str = None):
         """
@@ -75,16 +259,21 @@ class ChatCommunicator:
         Args:
             model: Specific model to clear, or None to clear all
         """
-        if model is None:
-            # Clear all cached models
-            self.logger.info("Clearing all cached models")
-            self._model_cache.clear()
-        else:
-            # Clear specific model
-            model_path = self.model_manager.get_model_path(model)
-            if model_path and model_path in self._model_cache:
-                self.logger.info(f"Clearing cached model: {model}")
-                del self._model_cache[model_path]
+        with self._cache_lock:
+            if model is None:
+                # Clear all cached models
+                self.logger.info("Clearing all cached models")
+                runners = list(self._model_cache.values())
+                self._model_cache.clear()
+            else:
+                # Clear specific model
+                runner = self._model_cache.pop(model, None)
+                runners = [runner] if runner is not None else []
+                if runners:
+                    self.logger.info(f"Clearing cached model: {model}")
+        
+        for runner in runners:
+            runner.close()
 
 
 # Global communicator instance
@@ -113,3 +302,63 @@ def send_chat(messages: List[Dict], model: str = None, use_local: bool = False)
     """
     communicator = get_chat_communicator()
     return communicator.send_chat(messages, model, use_local)
+
+
+def send_chat_stream(messages: List[Dict], model: str = None) -> Iterator[str]:
+    """
+    Convenience function to stream chat response chunks.
+    
+    Args:
+        messages: List of message dictionaries
+        model: Model name to use
+        
+    Yields:
+        Assistant's response content as it is generated
+    """
+    communicator = get_chat_communicator()
+    return communicator.send_chat_stream(messages, model)
+
+
+def send_chat_batch(conversations: List[List[Dict]], model: str = None) -> List[str]:
+    """
+    Convenience function to send several conversations to one model.
+    
+    Args:
+        conversations: List of message lists, one per conversation
+        model: Model name to use
+        
+    Returns:
+        Responses in the same order as conversations
+    """
+    communicator = get_chat_communicator()
+    return communicator.send_chat_batch(conversations, model)
+
+
+async def send_chat_async(messages: List[Dict], model: str = None) -> str:
+    """
+    Convenience function to send chat messages from async code.
+    
+    Args:
+        messages: List of message dictionaries
+        model: Model name to use
+        
+    Returns:
+        Assistant's response content
+    """
+    communicator = get_chat_communicator()
+    return await communicator.send_chat_async(messages, model)
+
+
+async def send_chat_many(conversations: List[List[Dict]], model: str = None) -> List[str]:
+    """
+    Convenience function to send several conversations concurrently.
+    
+    Args:
+        conversations: List of message lists, one per conversation
+        model: Model name to use
+        
+    Returns:
+        Responses in the same order as conversations
+    """
+    communicator = get_chat_communicator()
+    return await communicator.send_chat_many(conversations, model)
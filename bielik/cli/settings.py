@@ -5,11 +5,68 @@ Handles user personalization settings, model display names, and .env file manage
 """
 
 import os
-import subprocess
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
 from ..config import get_config, get_logger
+from ..models.model_files import atomic_write
+
+# Parsed CLI settings per .env file: {path: (mtime_ns, size, settings)}; an
+# unchanged file is not re-read, and saving refreshes the entry in place
+_ENV_CACHE: Dict[Path, Tuple[int, int, Dict[str, Any]]] = {}
+
+# .env keys owned by the CLI, rewritten on every save
+_BIELIK_CLI_KEYS = (
+    'BIELIK_CLI_USERNAME=',
+    'BIELIK_CLI_ASSISTANT_NAME=',
+    'BIELIK_CLI_CURRENT_MODEL=',
+    'BIELIK_CLI_AUTO_SWITCH=',
+)
+
+# BIELIK_CLI_* assignments anywhere in a .env file: (key, raw value)
+_ENV_RE = re.compile(r'^[ \t]*(BIELIK_CLI_[A-Z_]+)[ \t]*=(.*)$', re.MULTILINE)
+
+# .env key -> (settings key, value converter)
+_ENV_SETTINGS = {
+    'BIELIK_CLI_USERNAME': ('user_name', str),
+    'BIELIK_CLI_ASSISTANT_NAME': ('assistant_name', str),
+    'BIELIK_CLI_CURRENT_MODEL': ('current_model', str),
+    'BIELIK_CLI_AUTO_SWITCH': ('auto_switch_after_download', lambda value: value.lower() in ('true', '1', 'yes')),
+}
+
+# Known model families: (substring in the lowercased name, display name, emoji)
+_MODEL_TABLE = (
+    ('bielik', 'bielik', '🦅'),
+    ('llama', 'Llama', '🦙'),
+    ('mistral', 'Mistral', '🌪️'),
+    ('qwen', 'Qwen', '🐼'),
+    ('gemma', 'Gemma', '💎'),
+)
+
+
+@lru_cache(maxsize=1)
+def _default_username() -> str:
+    """Look up the OS user name once per process, without spawning `whoami`."""
+    try:
+        import pwd
+        username = pwd.getpwuid(os.getuid()).pw_name
+        if username:
+            return username.title()  # Capitalize first letter
+    except (ImportError, KeyError):
+        # No pwd module (Windows) or no passwd entry for this uid
+        pass
+
+    # Fallback to environment variables or default
+    return os.environ.get('USER', os.environ.get('USERNAME', 'You'))
+
+
+def _assistant_prompt_prefix(name: str) -> str:
+    """Build the assistant prompt prefix, choosing the emoji from the assistant name."""
+    name_lower = name.lower()
+    emoji = next((emoji for key, _, emoji in _MODEL_TABLE if key in name_lower), '🤖')
+    return f"{emoji} {name}:"
 
 
 class CLISettingsManager:
@@ -32,20 +89,16 @@ class CLISettingsManager:
         
         # Load existing settings from .env
         self._load_settings_from_env()
+        self._refresh_prompt_prefixes()
+    
+    def _refresh_prompt_prefixes(self):
+        """Rebuild the prompt prefixes; called whenever a display name changes."""
+        self._user_prefix = f"🧑 {self._settings['user_name']}:"
+        self._assistant_prefix = _assistant_prompt_prefix(self._settings['assistant_name'])
     
     def _get_default_username(self) -> str:
-        """Get default username from whoami command."""
-        try:
-            result = subprocess.run(['whoami'], capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                username = result.stdout.strip()
-                if username:
-                    return username.title()  # Capitalize first letter
-        except Exception as e:
-            self.logger.warning(f"Could not get username from whoami: {e}")
-        
-        # Fallback to environment variables or default
-        return os.environ.get('USER', os.environ.get('USERNAME', 'You'))
+        """Get default username of the current OS user."""
+        return _default_username()
     
     def _get_model_display_name(self, model_name: Optional[str] = None) -> str:
         """Generate short display name from model name."""
@@ -53,60 +106,53 @@ class CLISettingsManager:
             model_name = self.config.BIELIK_MODEL
         
         # Extract meaningful parts from model name
-        if 'bielik' in model_name.lower():
-            # For Bielik models, extract version info
-            parts = model_name.lower().split('-')
-            for part in parts:
-                if 'bielik' in part:
-                    continue
-                # Look for parts like "4.5b", "7b", "11b"
-                if any(char.isdigit() for char in part) and 'b' in part and 'v' not in part:
-                    return f"bielik-{part}"
-            return "bielik"
+        name_lower = model_name.lower()
+        for key, label, _ in _MODEL_TABLE:
+            if key not in name_lower:
+                continue
+            if key == 'bielik':
+                # For Bielik models, extract version info
+                for part in name_lower.split('-'):
+                    if 'bielik' in part:
+                        continue
+                    # Look for parts like "4.5b", "7b", "11b"
+                    if any(char.isdigit() for char in part) and 'b' in part and 'v' not in part:
+                        return f"bielik-{part}"
+            return label
         
-        elif 'llama' in model_name.lower():
-            return "Llama"
-        elif 'mistral' in model_name.lower():
-            return "Mistral"
-        elif 'qwen' in model_name.lower():
-            return "Qwen"
-        elif 'gemma' in model_name.lower():
-            return "Gemma"
-        else:
-            # Extract first meaningful part
-            parts = model_name.replace('/', '-').split('-')
-            if parts:
-                return parts[0].title()[:8]  # Max 8 chars
-            return "AI"
+        # Extract first meaningful part
+        parts = model_name.replace('/', '-').split('-')
+        if parts:
+            return parts[0].title()[:8]  # Max 8 chars
+        return "AI"
     
     def _load_settings_from_env(self):
         """Load settings from .env file if it exists."""
-        if not self.env_file_path.exists():
+        try:
+            st = self.env_file_path.stat()
+        except OSError:
             return
         
+        cached = _ENV_CACHE.get(self.env_file_path)
+        if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+            self._settings.update(cached[2])
+            return
+        
+        parsed = {}
         try:
-            with open(self.env_file_path, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line.startswith('#') or '=' not in line:
-                        continue
-                    
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip().strip('"').strip("'")
-                    
-                    # Map env variables to settings
-                    if key == 'BIELIK_CLI_USERNAME':
-                        self._settings['user_name'] = value
-                    elif key == 'BIELIK_CLI_ASSISTANT_NAME':
-                        self._settings['assistant_name'] = value
-                    elif key == 'BIELIK_CLI_CURRENT_MODEL':
-                        self._settings['current_model'] = value
-                    elif key == 'BIELIK_CLI_AUTO_SWITCH':
-                        self._settings['auto_switch_after_download'] = value.lower() in ('true', '1', 'yes')
-                        
+            data = self.env_file_path.read_text()
         except Exception as e:
             self.logger.warning(f"Could not load settings from .env: {e}")
+            return
+        
+        # Only CLI lines are visited; comments and other settings never match
+        for match in _ENV_RE.finditer(data):
+            setting, convert = _ENV_SETTINGS.get(match.group(1), (None, None))
+            if setting:
+                parsed[setting] = convert(match.group(2).strip().strip('"').strip("'"))
+        
+        _ENV_CACHE[self.env_file_path] = (st.st_mtime_ns, st.st_size, parsed)
+        self._settings.update(parsed)
     
     def _save_settings_to_env(self):
         """Save current settings to .env file."""
@@ -117,34 +163,28 @@ class CLISettingsManager:
                 with open(self.env_file_path, 'r') as f:
                     existing_lines = f.readlines()
             
-            # Remove old Bielik CLI settings
-            filtered_lines = []
-            for line in existing_lines:
-                if not any(line.strip().startswith(key) for key in [
-                    'BIELIK_CLI_USERNAME=',
-                    'BIELIK_CLI_ASSISTANT_NAME=', 
-                    'BIELIK_CLI_CURRENT_MODEL=',
-                    'BIELIK_CLI_AUTO_SWITCH='
-                ]):
-                    filtered_lines.append(line)
+            # Keep everything except old Bielik CLI settings
+            out = [line for line in existing_lines if not line.lstrip().startswith(_BIELIK_CLI_KEYS)]
             
             # Add current settings
-            cli_settings = [
-                f'# Bielik CLI Settings\n',
-                f'BIELIK_CLI_USERNAME="{self._settings["user_name"]}"\n',
-                f'BIELIK_CLI_ASSISTANT_NAME="{self._settings["assistant_name"]}"\n',
-            ]
-            
+            out.append('# Bielik CLI Settings\n')
+            out.append(f'BIELIK_CLI_USERNAME="{self._settings["user_name"]}"\n')
+            out.append(f'BIELIK_CLI_ASSISTANT_NAME="{self._settings["assistant_name"]}"\n')
             if self._settings['current_model']:
-                cli_settings.append(f'BIELIK_CLI_CURRENT_MODEL="{self._settings["current_model"]}"\n')
+                out.append(f'BIELIK_CLI_CURRENT_MODEL="{self._settings["current_model"]}"\n')
+            out.append(f'BIELIK_CLI_AUTO_SWITCH="{str(self._settings["auto_switch_after_download"]).lower()}"\n\n')
             
-            cli_settings.append(f'BIELIK_CLI_AUTO_SWITCH="{str(self._settings["auto_switch_after_download"]).lower()}"\n')
-            cli_settings.append('\n')
+            # Write updated .env file in one call, replacing it atomically;
+            # a symlinked .env and the file's permissions (it may hold HF_TOKEN) are kept
+            atomic_write(self.env_file_path, ''.join(out).encode('utf-8'))
             
-            # Write updated .env file
-            with open(self.env_file_path, 'w') as f:
-                f.writelines(filtered_lines)
-                f.writelines(cli_settings)
+            # What was just written is what the next load would parse
+            saved = {key: self._settings[key]
+                     for key in ('user_name', 'assistant_name', 'auto_switch_after_download')}
+            if self._settings['current_model']:
+                saved['current_model'] = self._settings['current_model']
+            st = self.env_file_path.stat()
+            _ENV_CACHE[self.env_file_path] = (st.st_mtime_ns, st.st_size, saved)
             
             self.logger.info(f"CLI settings saved to {self.env_file_path}")
             
@@ -167,6 +207,7 @@ class CLISettingsManager:
         """Set user display name and save to .env."""
         try:
             self._settings['user_name'] = name.strip().title()
+            self._refresh_prompt_prefixes()
             self._save_settings_to_env()
             return True
         except Exception as e:
@@ -178,6 +219,7 @@ class CLISettingsManager:
         try:
             self._settings['current_model'] = model_name
             self._settings['assistant_name'] = self._get_model_display_name(model_name)
+            self._refresh_prompt_prefixes()
             self._save_settings_to_env()
             return True
         except Exception as e:
@@ -190,26 +232,11 @@ class CLISettingsManager:
     
     def get_user_prompt_prefix(self) -> str:
         """Get formatted user prompt prefix."""
-        return f"🧑 {self.get_user_name()}:"
+        return self._user_prefix
     
     def get_assistant_prompt_prefix(self) -> str:
         """Get formatted assistant prompt prefix."""
-        name = self.get_assistant_name()
-        # Choose emoji based on assistant name
-        if 'bielik' in name.lower():
-            emoji = '🦅'
-        elif 'llama' in name.lower():
-            emoji = '🦙'
-        elif 'mistral' in name.lower():
-            emoji = '🌪️'
-        elif 'qwen' in name.lower():
-            emoji = '🐼'
-        elif 'gemma' in name.lower():
-            emoji = '💎'
-        else:
-            emoji = '🤖'
-        
-        return f"{emoji} {name}:"
+        return self._assistant_prefix
     
     def get_settings_summary(self) -> Dict[str, Any]:
         """Get summary of all current settings."""
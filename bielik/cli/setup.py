@@ -5,12 +5,12 @@ Bielik CLI Setup Manager - Handles interactive setup and system configuration.
 This module provides guidance for setting up HuggingFace models for local execution.
 """
 
-import os
-import platform
-from typing import Optional, List
+from typing import List
 from pathlib import Path
 
+from .._compat import HAS_LLAMA_CPP
 from ..config import get_config, get_logger
+from ..models.model_files import find_gguf_files_cached, get_hf_home_dir
 
 
 class SetupManager:
@@ -22,53 +22,32 @@ class SetupManager:
         
     def check_llama_cpp_installed(self) -> bool:
         """Check if llama-cpp-python is installed."""
-        try:
-            import llama_cpp
-            return True
-        except ImportError:
-            return False
+        return HAS_LLAMA_CPP
     
     def get_hf_cache_dir(self) -> Path:
         """Get HuggingFace cache directory."""
-        hf_home = os.environ.get('HF_HOME')
-        if hf_home:
-            return Path(hf_home)
-        
-        cache_home = os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache'))
-        return Path(cache_home) / 'huggingface'
+        return get_hf_home_dir()
     
     def find_local_models(self) -> List[str]:
         """Find locally downloaded GGUF models."""
-        cache_dir = self.get_hf_cache_dir()
-        models = []
-        
-        if not cache_dir.exists():
-            return models
-        
-        # Search for GGUF files
-        for path in cache_dir.rglob('*.gguf'):
-            models.append(str(path))
-        
-        return models
+        return find_gguf_files_cached(self.get_hf_cache_dir())
     
     def check_system_status(self) -> str:
         """Check overall system status."""
-        status = []
-        
         # Check llama-cpp-python
         if self.check_llama_cpp_installed():
-            status.append("✅ llama-cpp-python is installed")
+            llama_status = "✅ llama-cpp-python is installed"
         else:
-            status.append("❌ llama-cpp-python is NOT installed")
+            llama_status = "❌ llama-cpp-python is NOT installed"
         
         # Check for local models
-        models = self.find_local_models()
-        if models:
-            status.append(f"✅ Found {len(models)} local GGUF model(s)")
+        model_count = len(self.find_local_models())
+        if model_count:
+            models_status = f"✅ Found {model_count} local GGUF model(s)"
         else:
-            status.append("⚠️ No local GGUF models found")
+            models_status = "⚠️ No local GGUF models found"
         
-        return "\n".join(status)
+        return f"{llama_status}\n{models_status}"
     
     def interactive_setup(self) -> bool:
         """Interactive setup process for first-time users."""
@@ -6,8 +6,10 @@ This module provides the main BielikClient class for local HuggingFace model exe
 conversation management, and system integration. All content has been converted to English.
 """
 
+import asyncio
 import os
-from typing import List, Dict, Optional, Union, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Dict, Optional, Union, Any
 from pathlib import Path
 
 from .model_manager import ClientModelManager
@@ -63,6 +65,16 @@ class BielikClient:
         if auto_setup:
             self.ensure_setup()
     
+    def close(self):
+        """Release resources held by the client, such as pooled network connections."""
+        self.utils.close()
+    
+    def __enter__(self) -> "BielikClient":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
     def reset_conversation(self):
         """Reset conversation history with system prompt."""
         self.messages = [{"role": "system", "content": self.system_prompt}]
@@ -107,6 +119,24 @@ class BielikClient:
         self.logger.info(f"Setup complete. Using model: {self.model_path}")
         return True
     
+    def _start_turn(self, message: str, add_to_history: bool) -> List[Dict[str, str]]:
+        """
+        Build the messages to send for a user message.
+        
+        With add_to_history, the user turn is appended to the history and the
+        history itself is sent, not a copy; callers pop it again if no reply
+        comes. Otherwise a new list is built and the history is untouched.
+        """
+        user_message = {"role": "user", "content": message}
+        if add_to_history:
+            self.messages.append(user_message)
+            return self.messages
+        return self.messages + [user_message]
+    
+    def _commit_turn(self, response: str):
+        """Complete the turn opened by _start_turn with the assistant's reply."""
+        self.messages.append({"role": "assistant", "content": response})
+    
     def send_message(self, message: str, add_to_history: bool = True) -> str:
         """
         Send a message to Bielik and get response.
@@ -118,33 +148,69 @@ class BielikClient:
         Returns:
             Assistant's response
         """
-        # Prepare messages for this request
-        request_messages = self.messages.copy()
-        request_messages.append({"role": "user", "content": message})
+        request_messages = self._start_turn(message, add_to_history)
         
         # Initialize and use local model
         try:
             if not self.model_manager.initialize_local_runner(self.model_path, self.model_kwargs):
                 error_msg = "Failed to initialize local model runner"
-                self.logger.error(error_msg)
-                return f"[ERROR] {error_msg}"
-            
-            response_content = self.model_manager.chat_with_local_model(request_messages)
+            else:
+                response_content = self.model_manager.chat_with_local_model(request_messages)
+                
+                if add_to_history:
+                    self._commit_turn(response_content)
+                
+                return response_content
             
-            if add_to_history:
-                self.messages.append({"role": "user", "content": message})
-                self.messages.append({"role": "assistant", "content": response_content})
+        except ImportError as e:
+            error_msg = "llama-cpp-python not installed. Install with: conda install -c conda-forge llama-cpp-python"
+        except Exception as e:
+            error_msg = f"Model execution failed: {e}"
+        
+        if add_to_history:
+            self.messages.pop()
+        self.logger.error(error_msg)
+        return f"[ERROR] {error_msg}"
+    
+    def stream_message(self, message: str, add_to_history: bool = True) -> Iterator[str]:
+        """
+        Send a message to Bielik and yield the response as it is generated.
+        
+        Args:
+            message: User message to send
+            add_to_history: Whether to add to conversation history
             
-            return response_content
+        Yields:
+            Response text chunks; errors are yielded as a single "[ERROR] ..." chunk
+        """
+        request_messages = self._start_turn(message, add_to_history)
+        
+        chunks = []
+        completed = False
+        try:
+            if not self.model_manager.initialize_local_runner(self.model_path, self.model_kwargs):
+                error_msg = "Failed to initialize local model runner"
+            else:
+                for chunk in self.model_manager.chat_stream_with_local_model(request_messages):
+                    chunks.append(chunk)
+                    yield chunk
+                
+                if add_to_history:
+                    self._commit_turn("".join(chunks))
+                completed = True
+                return
             
-        except ImportError as e:
+        except ImportError:
             error_msg = "llama-cpp-python not installed. Install with: conda install -c conda-forge llama-cpp-python"
-            self.logger.error(error_msg)
-            return f"[ERROR] {error_msg}"
         except Exception as e:
             error_msg = f"Model execution failed: {e}"
-            self.logger.error(error_msg)
-            return f"[ERROR] {error_msg}"
+        finally:
+            # Also rolls back when the caller stops iterating early
+            if add_to_history and not completed:
+                self.messages.pop()
+        
+        self.logger.error(error_msg)
+        yield f"[ERROR] {error_msg}"
     
     def chat(self, message: str) -> str:
         """Alias for send_message with history enabled."""
@@ -154,6 +220,50 @@ class BielikClient:
         """Send a one-off query without affecting conversation history."""
         return self.send_message(message, add_to_history=False)
     
+    async def query_async(self, message: str) -> str:
+        """
+        Send a one-off query without blocking the event loop.
+        
+        Generation runs in a worker thread; history is not affected.
+        
+        Args:
+            message: User message to send
+            
+        Returns:
+            Assistant's response
+        """
+        return await asyncio.to_thread(self.query, message)
+    
+    async def query_many(self, messages: List[str]) -> List[str]:
+        """
+        Send several independent one-off queries concurrently.
+        
+        The model runner serializes generation, so this mainly keeps the
+        event loop free while the batch runs.
+        
+        Args:
+            messages: User messages, each sent as its own query
+            
+        Returns:
+            Responses in the same order as messages; if the model cannot be
+            loaded, every response is the same "[ERROR] ..." message
+        """
+        # Load the model once up front; if that fails, stop here rather than
+        # let every query retry the load concurrently
+        try:
+            ready = await asyncio.to_thread(self.model_manager.initialize_local_runner,
+                                            self.model_path, self.model_kwargs)
+            error_msg = "Failed to initialize local model runner"
+        except Exception as e:
+            ready = False
+            error_msg = f"Model execution failed: {e}"
+        
+        if not ready:
+            self.logger.error(error_msg)
+            return [f"[ERROR] {error_msg}"] * len(messages)
+        
+        return list(await asyncio.gather(*(self.query_async(message) for message in messages)))
+    
     def get_conversation_history(self) -> List[Dict[str, str]]:
         """Get current conversation history."""
         return self.messages.copy()
@@ -185,22 +295,28 @@ class BielikClient:
     
     def get_system_status(self) -> Dict[str, Any]:
         """Get comprehensive system status information."""
-        status = {
-            "client_config": {
-                "model": self.model,
-                "model_path": self.model_path,
-                "llama_cpp_installed": self.utils.check_llama_cpp_installed()
-            },
-            "system_info": self.utils.get_system_info(),
-            "network": self.utils.check_network_connectivity()
-        }
-        
-        # Add model info if path is set
-        if self.model_path:
-            status["model_info"] = self.utils.get_model_info(self.model_path)
+        # Network probes and the local model scan are independent I/O; overlap them
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            network = executor.submit(self.utils.check_network_connectivity)
+            local_models = executor.submit(self.utils.find_local_gguf_models)
+            
+            status = {
+                "client_config": {
+                    "model": self.model,
+                    "model_path": self.model_path,
+                    "llama_cpp_installed": self.utils.check_llama_cpp_installed()
+                },
+                "system_info": self.utils.get_system_info(),
+            }
+            
+            # Add model info if path is set
+            if self.model_path:
+                status["model_info"] = self.utils.get_model_info(self.model_path)
+            
+            status["network"] = network.result()
+            local_models = local_models.result()
         
         # List available local models
-        local_models = self.utils.find_local_gguf_models()
         status["local_models_found"] = len(local_models)
         status["local_models"] = local_models[:5]  # Show first 5
         
@@ -7,10 +7,10 @@ including Hugging Face model operations and local model initialization.
 All content has been converted to English as requested.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, Optional
 from pathlib import Path
 
-from ..hf_models import get_model_manager, LocalLlamaRunner, HAS_LLAMA_CPP
+from ..hf_models import get_model_manager, LocalLlamaRunner, HAS_LLAMA_CPP, SPEAKLEASH_MODELS_SET
 from ..config import get_config, get_logger
 
 
@@ -90,7 +90,7 @@ class ClientModelManager:
             return False
         
         # Check if model is a local HF model name
-        if model_name in self.hf_model_manager.SPEAKLEASH_MODELS:
+        if model_name in SPEAKLEASH_MODELS_SET:
             model_path = self.hf_model_manager.get_model_path(model_name)
             if not model_path:
                 self.logger.warning(f"Model {model_name} not downloaded locally")
@@ -126,6 +126,21 @@ class ClientModelManager:
         
         return self.local_runner.chat(messages)
     
+    def chat_stream_with_local_model(self, messages: list) -> Iterator[str]:
+        """
+        Send messages to local model and yield the response as it is generated.
+        
+        Args:
+            messages: List of message dictionaries
+            
+        Yields:
+            Response text chunks
+        """
+        if self.local_runner is None:
+            raise RuntimeError("Local runner not initialized")
+        
+        yield from self.local_runner.chat_stream(messages)
+    
     def switch_to_hf_model(self, model_name: str, **local_kwargs) -> bool:
         """
         Switch to using a local HF model.
@@ -171,11 +186,10 @@ class ClientModelManager:
             "has_llama_cpp": HAS_LLAMA_CPP
         }
         
-        if use_local and model_name in self.hf_model_manager.SPEAKLEASH_MODELS:
+        if use_local and model_name in SPEAKLEASH_MODELS_SET:
             if self.is_hf_model_downloaded(model_name):
-                downloaded = self.get_downloaded_hf_models()
-                if model_name in downloaded:
-                    model_info = downloaded[model_name]
+                model_info = self.hf_model_manager.get_model_info(model_name)
+                if model_info:
                     info.update({
                         "local_path": model_info.local_path,
                         "file_size_gb": model_info.size_bytes / (1024**3),
@@ -8,13 +8,96 @@ All content has been converted to English as requested.
 """
 
 import os
-import json
-import requests
 import platform
-from typing import Dict, Any, List, Union
+import stat
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, Iterator, List, Optional, Union
 from pathlib import Path
 
+from .._compat import HAS_LLAMA_CPP, json_dumps_pretty
 from ..config import get_config, get_logger
+from ..models.model_files import find_gguf_files_cached, get_hf_home_dir
+
+# Timeout (seconds) for a single liveness probe
+_PROBE_TIMEOUT = 2.0
+
+# Services checked by check_network_connectivity: {name: URL}
+_CONNECTIVITY_PROBES = {
+    "huggingface": "https://hf.co",
+    "internet": "https://httpbin.org/get",
+}
+
+
+@lru_cache(maxsize=None)
+def _requests():
+    """Return the requests module, importing it on first network check."""
+    import requests
+    return requests
+
+
+@lru_cache(maxsize=1)
+def _platform_info() -> Dict[str, str]:
+    """
+    Collect platform details once per process; they cannot change while it
+    runs, and platform.processor() may spawn `uname -p` on Linux.
+    """
+    return {
+        "platform": platform.system(),
+        "platform_version": platform.release(),
+        "python_version": platform.python_version(),
+        "architecture": platform.machine(),
+        "processor": platform.processor() or "Unknown"
+    }
+
+
+def _export_json(messages: List[Dict[str, str]]) -> Dict[str, Any]:
+    """Wrap the conversation in a JSON-serializable export document."""
+    return {
+        "conversation": messages,
+        "message_count": len(messages),
+        "export_format": "json"
+    }
+
+
+def _export_text(messages: List[Dict[str, str]]) -> str:
+    """Render the conversation as plain "ROLE: content" blocks."""
+    turns = ((msg.get("role", "unknown").upper(), msg.get("content", "")) for msg in messages)
+    # Skip system messages in text export; empty line between messages
+    return "".join(f"{role}: {content}\n\n" for role, content in turns if role != "SYSTEM")[:-1]
+
+
+def _export_markdown(messages: List[Dict[str, str]]) -> str:
+    """Render the conversation as a Markdown document."""
+    return "\n".join(_markdown_lines(messages))
+
+
+def _markdown_lines(messages: List[Dict[str, str]]) -> Iterator[str]:
+    """Yield the lines of a Markdown conversation export."""
+    yield "# Bielik Conversation Export"
+    yield ""
+    for msg in messages:
+        role = msg.get("role", "unknown")
+        content = msg.get("content", "")
+        if role == "system":
+            yield f"**System Prompt:** {content}"
+        elif role == "user":
+            yield "## User"
+            yield content
+        elif role == "assistant":
+            yield "## Assistant"
+            yield content
+        yield ""  # Empty line between messages
+
+
+# Export format name -> exporter
+_EXPORTERS = {
+    "json": _export_json,
+    "text": _export_text,
+    "markdown": _export_markdown,
+}
 
 
 class ClientUtils:
@@ -23,37 +106,52 @@ class ClientUtils:
     def __init__(self):
         self.config = get_config()
         self.logger = get_logger(__name__)
+        
+        # Pooled keep-alive connections shared by all network checks,
+        # created (and requests imported) on first use
+        self._session = None
+        self._session_lock = threading.Lock()
+        
+        # Last connectivity result and when it was taken (time.monotonic())
+        self._connectivity: Optional[Dict[str, bool]] = None
+        self._connectivity_ts = 0.0
+        self._refresh_lock = threading.Lock()
+        self._refreshing = False
+    
+    @property
+    def session(self):
+        """HTTP session for network checks, created on first use."""
+        with self._session_lock:
+            if self._session is None:
+                requests = _requests()
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=0)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                session.headers.update({
+                    'Connection': 'keep-alive',
+                    'Accept-Encoding': 'gzip, deflate',
+                    'User-Agent': 'bielik-client/1.0',
+                })
+                self._session = session
+            return self._session
+    
+    def close(self) -> None:
+        """Release pooled network connections."""
+        if self._session is not None:
+            self._session.close()
     
     def check_llama_cpp_installed(self) -> bool:
         """Check if llama-cpp-python is installed."""
-        try:
-            import llama_cpp
-            return True
-        except ImportError:
-            return False
+        return HAS_LLAMA_CPP
     
     def get_hf_cache_dir(self) -> Path:
         """Get HuggingFace cache directory."""
-        hf_home = os.environ.get('HF_HOME')
-        if hf_home:
-            return Path(hf_home)
-        
-        cache_home = os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache'))
-        return Path(cache_home) / 'huggingface'
+        return get_hf_home_dir()
     
     def find_local_gguf_models(self) -> List[str]:
         """Find locally downloaded GGUF models."""
-        cache_dir = self.get_hf_cache_dir()
-        models = []
-        
-        if not cache_dir.exists():
-            return models
-        
-        # Search for GGUF files
-        for path in cache_dir.rglob('*.gguf'):
-            models.append(str(path))
-        
-        return models
+        return find_gguf_files_cached(self.get_hf_cache_dir())
     
     def export_conversation(self, messages: List[Dict[str, str]], format: str = "json") -> Union[str, Dict]:
         """
@@ -66,41 +164,10 @@ class ClientUtils:
         Returns:
             Formatted conversation data
         """
-        if format.lower() == "json":
-            return {
-                "conversation": messages,
-                "message_count": len(messages),
-                "export_format": "json"
-            }
-        
-        elif format.lower() == "text":
-            lines = []
-            for msg in messages:
-                role = msg.get("role", "unknown").upper()
-                content = msg.get("content", "")
-                if role != "SYSTEM":  # Skip system messages in text export
-                    lines.append(f"{role}: {content}")
-                    lines.append("")  # Empty line between messages
-            return "\n".join(lines)
-        
-        elif format.lower() == "markdown":
-            lines = ["# Bielik Conversation Export", ""]
-            for msg in messages:
-                role = msg.get("role", "unknown")
-                content = msg.get("content", "")
-                if role == "system":
-                    lines.append(f"**System Prompt:** {content}")
-                elif role == "user":
-                    lines.append(f"## User")
-                    lines.append(content)
-                elif role == "assistant":
-                    lines.append(f"## Assistant")
-                    lines.append(content)
-                lines.append("")  # Empty line between messages
-            return "\n".join(lines)
-        
-        else:
+        exporter = _EXPORTERS.get(format.lower())
+        if exporter is None:
             raise ValueError(f"Unsupported export format: {format}")
+        return exporter(messages)
     
     def save_conversation(self, messages: List[Dict[str, str]], filepath: str, format: str = "json") -> bool:
         """
@@ -121,8 +188,8 @@ class ClientUtils:
             Path(filepath).parent.mkdir(parents=True, exist_ok=True)
             
             if format.lower() == "json":
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    json.dump(content, f, indent=2, ensure_ascii=False)
+                with open(filepath, 'wb') as f:
+                    f.write(json_dumps_pretty(content))
             else:
                 with open(filepath, 'w', encoding='utf-8') as f:
                     f.write(content)
@@ -136,33 +203,73 @@ class ClientUtils:
     
     def get_system_info(self) -> Dict[str, Any]:
         """Get basic system information."""
-        return {
-            "platform": platform.system(),
-            "platform_version": platform.release(),
-            "python_version": platform.python_version(),
-            "architecture": platform.machine(),
-            "processor": platform.processor() or "Unknown"
-        }
+        return dict(_platform_info())
     
-    def check_network_connectivity(self) -> Dict[str, bool]:
-        """Check network connectivity to various services."""
-        connectivity = {}
+    def _probe_url(self, url: str) -> bool:
+        """
+        Check whether a URL is reachable.
         
-        # Check Hugging Face
+        A HEAD request is enough for a yes/no answer: no body is downloaded and
+        redirects are not followed. Any response below 500 means the service
+        is up.
+        """
         try:
-            resp = requests.get("https://hf.co", timeout=5)
-            connectivity["huggingface"] = resp.status_code == 200
-        except Exception:
-            connectivity["huggingface"] = False
+            resp = self.session.head(url, timeout=_PROBE_TIMEOUT)
+            return resp.status_code < 500
+        except _requests().RequestException:
+            return False
+    
+    def reset_cache(self) -> None:
+        """Forget the cached connectivity result so the next check probes again."""
+        self._connectivity = None
+        self._connectivity_ts = 0.0
+    
+    def _probe_connectivity(self) -> Dict[str, bool]:
+        """Probe all services now and cache the result."""
+        # The probes are independent, so run them side by side
+        with ThreadPoolExecutor(max_workers=len(_CONNECTIVITY_PROBES)) as executor:
+            results = executor.map(self._probe_url, _CONNECTIVITY_PROBES.values())
+            connectivity = dict(zip(_CONNECTIVITY_PROBES, results))
         
-        # Check general internet
-        try:
-            resp = requests.get("https://httpbin.org/get", timeout=5)
-            connectivity["internet"] = resp.status_code == 200
-        except Exception:
-            connectivity["internet"] = False
+        self._connectivity = connectivity
+        self._connectivity_ts = time.monotonic()
+        return dict(connectivity)
+    
+    def _refresh_in_background(self) -> None:
+        """Start one background connectivity probe unless one is already running."""
+        with self._refresh_lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        
+        def refresh():
+            try:
+                self._probe_connectivity()
+            finally:
+                self._refreshing = False
         
-        return connectivity
+        threading.Thread(target=refresh, name="bielik-connectivity", daemon=True).start()
+    
+    def check_network_connectivity(self, force: bool = False) -> Dict[str, bool]:
+        """
+        Check network connectivity to various services.
+        
+        Results stay fresh for NETWORK_CHECK_TTL seconds. After that the last
+        result is still returned at once while a background probe refreshes
+        it (stale-while-revalidate), so only the very first check waits.
+        
+        Args:
+            force: Probe now, ignoring any cached result
+            
+        Returns:
+            Mapping of service name to reachability
+        """
+        if force or self._connectivity is None:
+            return self._probe_connectivity()
+        
+        if time.monotonic() - self._connectivity_ts >= self.config.NETWORK_CHECK_TTL:
+            self._refresh_in_background()
+        return dict(self._connectivity)
     
     def get_model_info(self, model_path: str) -> Dict[str, Any]:
         """Get information about a local model file."""
@@ -174,9 +281,13 @@ class ClientUtils:
             "format": None
         }
         
-        if os.path.exists(model_path):
+        try:
+            size = os.stat(model_path).st_size
+        except OSError:
+            size = None
+        
+        if size is not None:
             info["exists"] = True
-            size = os.path.getsize(model_path)
             info["size"] = size
             info["size_mb"] = round(size / (1024 * 1024), 2)
             
@@ -201,10 +312,13 @@ class ClientUtils:
         if not model_path:
             return False, "No model path provided"
         
-        if not os.path.exists(model_path):
+        # One stat() answers existence, file type and size
+        try:
+            st = os.stat(model_path)
+        except OSError:
             return False, f"Model file not found: {model_path}"
         
-        if not os.path.isfile(model_path):
+        if not stat.S_ISREG(st.st_mode):
             return False, f"Path is not a file: {model_path}"
         
         # Check if it's a GGUF file (preferred format)
@@ -212,7 +326,7 @@ class ClientUtils:
             return False, f"File is not a GGUF model: {model_path}"
         
         # Check file size (should be at least 1MB)
-        size = os.path.getsize(model_path)
+        size = st.st_size
         if size < 1024 * 1024:
             return False, f"File too small to be a valid model: {size} bytes"
         
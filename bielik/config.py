@@ -120,6 +120,9 @@ class BielikConfig:
         self.REQUEST_TIMEOUT = self._get_env_int("REQUEST_TIMEOUT", 30)
         self.MODEL_TIMEOUT = self._get_env_int("MODEL_TIMEOUT", 300)
         self.SETUP_TIMEOUT = self._get_env_int("SETUP_TIMEOUT", 1800)
+        self.MODEL_CACHE_SIZE = self._get_env_int("MODEL_CACHE_SIZE", 2)  # Loaded models kept in memory
+        self.MODEL_PRELOAD = self._get_env_bool("MODEL_PRELOAD", True)  # Load the chat model in the background at startup
+        self.NETWORK_CHECK_TTL = self._get_env_int("NETWORK_CHECK_TTL", 30)  # Seconds a connectivity check stays fresh
         
         # Development Settings
         self.DEBUG_MODE = self._get_env_bool("DEBUG_MODE", False)
@@ -235,6 +238,9 @@ class BielikConfig:
             f"REQUEST_TIMEOUT={self.REQUEST_TIMEOUT}",
             f"MODEL_TIMEOUT={self.MODEL_TIMEOUT}",
             f"SETUP_TIMEOUT={self.SETUP_TIMEOUT}",
+            f"MODEL_CACHE_SIZE={self.MODEL_CACHE_SIZE}",
+            f"MODEL_PRELOAD={str(self.MODEL_PRELOAD).lower()}",
+            f"NETWORK_CHECK_TTL={self.NETWORK_CHECK_TTL}",
             "",
             "# Development Settings",
             f"DEBUG_MODE={str(self.DEBUG_MODE).lower()}",
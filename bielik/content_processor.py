@@ -13,6 +13,8 @@ from urllib.parse import urlparse, urljoin
 import logging
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 import html2text
 
@@ -53,6 +55,10 @@ except ImportError:
 
 from .config import get_config, get_logger
 
+# Every URL/path pattern below needs a "/" (URLs, ./ and / paths) or a ":"
+# (drive letters), so text with neither cannot reference any content
+_CONTENT_MARKERS = ("/", ":")
+
 
 class ContentProcessor:
     """
@@ -70,6 +76,40 @@ class ContentProcessor:
         self.html_converter.ignore_images = True
         self.html_converter.ignore_emphasis = False
         self.html_converter.body_width = 0  # No line wrapping
+        
+        # One pooled keep-alive session for all URL fetches
+        self.session = self._create_session()
+        
+        # Blocked domains normalized once, not on every URL check
+        self._blocked_domains = frozenset(
+            blocked.strip().lstrip('.').lower() for blocked in self.config.BLOCKED_DOMAINS
+        ) - {''}
+    
+    def _create_session(self) -> requests.Session:
+        """Create an HTTP session with connection pooling and one retry on transient errors."""
+        session = requests.Session()
+        # A single retry keeps the worst case near one REQUEST_TIMEOUT; read
+        # timeouts are not retried, since a slow server would just time out again
+        retry = Retry(
+            total=1,
+            connect=1,
+            read=0,
+            backoff_factor=0.3,
+            status_forcelist=[429, 502, 503, 504],
+            allowed_methods=["GET", "HEAD"],
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (compatible; Bielik/1.0; +https://github.com/tomsapletta/bielik)',
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.5',
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive',
+        })
+        return session
     
     def is_url(self, text: str) -> bool:
         """Check if text is a valid URL."""
@@ -88,13 +128,20 @@ class ContentProcessor:
             return False
     
     def is_blocked_domain(self, url: str) -> bool:
-        """Check if URL domain is blocked."""
-        if not self.config.BLOCKED_DOMAINS:
+        """
+        Check if URL domain is blocked.
+        
+        A blocked domain matches itself and its subdomains, so blocking
+        "example.com" covers "www.example.com" but not "notexample.com".
+        """
+        if not self._blocked_domains:
             return False
         
         try:
-            domain = urlparse(url).netloc.lower()
-            return any(blocked.lower() in domain for blocked in self.config.BLOCKED_DOMAINS)
+            host = urlparse(url).hostname or ''
+            labels = host.split('.')
+            # host itself, then each parent domain: a.b.c -> b.c -> c
+            return any('.'.join(labels[i:]) in self._blocked_domains for i in range(len(labels)))
         except Exception:
             return False
     
@@ -119,17 +166,8 @@ class ContentProcessor:
         try:
             self.logger.info(f"Fetching URL content: {url}")
             
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (compatible; Bielik/1.0; +https://github.com/tomsapletta/bielik)',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Accept-Encoding': 'gzip, deflate',
-                'Connection': 'keep-alive',
-            }
-            
-            response = requests.get(
+            response = self.session.get(
                 url, 
-                headers=headers, 
                 timeout=self.config.REQUEST_TIMEOUT,
                 allow_redirects=True
             )
@@ -343,6 +381,10 @@ class ContentProcessor:
         Returns:
             Enhanced text with fetched content appended
         """
+        # Cheap pre-filter: plain conversational input skips all regex scans
+        if not any(marker in text for marker in _CONTENT_MARKERS):
+            return text
+        
         enhanced_parts = [text]
         
         # Find URLs in text
@@ -17,12 +17,7 @@ import logging
 from huggingface_hub import hf_hub_download, list_repo_files, HfApi
 from huggingface_hub.utils import HfHubHTTPError
 
-try:
-    from llama_cpp import Llama
-    HAS_LLAMA_CPP = True
-except ImportError:
-    HAS_LLAMA_CPP = False
-
+from ._compat import HAS_LLAMA_CPP
 from .config import get_config, get_logger
 from .progress_logger import ProgressLogger
 from .models.model_exceptions import ModelLoadingError, ModelLoadingTimeoutError
@@ -31,6 +26,9 @@ from .models.model_registry import ModelInfo
 from .models.model_manager import SpeakLeashModelManager
 from .models.local_runner import LocalLlamaRunner
 
+# Names of supported SpeakLeash models, built once at import
+SPEAKLEASH_MODELS_SET = SpeakLeashModelManager.SPEAKLEASH_MODELS_SET
+
 # Model loading utilities and timeout handling now imported from .models.model_loading
 
 # All model loading utilities now imported from .models.model_loading
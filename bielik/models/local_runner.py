@@ -5,20 +5,34 @@ Provides chat interface without requiring external dependencies.
 """
 
 import os
+import threading
 import time
-from typing import Dict, List
+from typing import Dict, Iterator, List, Tuple
 
 try:
     from llama_cpp import Llama
-    HAS_LLAMA_CPP = True
 except ImportError:
-    HAS_LLAMA_CPP = False
+    Llama = None
 
 from ..config import get_config, get_logger
 from ..progress_logger import ProgressLogger
 from .model_exceptions import ModelLoadingError, ModelLoadingTimeoutError
 from .model_loading import load_with_timeout, get_model_loading_timeout, is_debug_mode
 
+# Tokens allowed for a role prefix and its separating newline
+_ROLE_PREFIX_TOKENS = 4
+
+# Distinct message contents whose token counts are kept per runner
+_TOKEN_COUNT_CACHE_SIZE = 4096
+
+# Prompt prefix for each supported chat role
+_ROLE_PREFIXES = {
+    'system': "System:",
+    'user': "User:",
+    'assistant': "Assistant:",
+}
+
+
 class LocalLlamaRunner:
     """
     Runs GGUF models locally using llama-cpp-python.
@@ -38,7 +52,7 @@ class LocalLlamaRunner:
             ModelLoadingError: If model loading fails
             ModelLoadingTimeoutError: If model loading times out
         """
-        if not HAS_LLAMA_CPP:
+        if Llama is None:
             raise ImportError("llama-cpp-python is required for local model execution")
         
         self.config = get_config()
@@ -46,6 +60,11 @@ class LocalLlamaRunner:
         self.model_path = model_path
         self.model = None
         self.progress_logger = ProgressLogger(self.logger)
+        # A llama-cpp context serves one generation at a time
+        self._inference_lock = threading.Lock()
+        # Token counts per message content, so a long conversation is only
+        # tokenized once per message rather than in full on every turn
+        self._token_counts: Dict[str, int] = {}
         
         # Default parameters
         default_params = {
@@ -105,20 +124,17 @@ class LocalLlamaRunner:
             self.logger.error(f"Failed to load model: {str(e)}", exc_info=is_debug_mode())
             raise ModelLoadingError(f"Failed to load model: {str(e)}")
 
-    def chat(self, messages: List[Dict[str, str]], **kwargs) -> str:
+    def _prepare_generation(self, messages: List[Dict[str, str]], kwargs: Dict) -> Tuple[str, Dict]:
         """
-        Generate chat response with detailed progress tracking and auto-optimized
-        parameters for short prompts.
+        Build the prompt and generation parameters, auto-optimized for short prompts.
 
         Args:
             messages: List of message dicts with 'role' and 'content'
-            **kwargs: Additional generation parameters (override auto-tuning)
+            kwargs: Generation parameters passed by the caller (override auto-tuning)
 
         Returns:
-            Generated response text
+            Tuple of (prompt, generation parameters)
         """
-        import time
-
         # Convert messages to prompt
         prompt = self._messages_to_prompt(messages)
         prompt_length = len(prompt)
@@ -183,7 +199,16 @@ class LocalLlamaRunner:
 
         max_tokens = params.get("max_tokens", 2048)
 
-        # Start progress tracking and log summary
+        # Drop the oldest turns if the conversation no longer fits the context window
+        fitted = self._fit_context(messages, self.params.get("n_ctx", 4096) - max_tokens)
+        if fitted is not messages:
+            dropped = len(messages) - len(fitted)
+            self.logger.warning(f"Conversation exceeds the context window, "
+                                f"dropped {dropped} oldest message(s)")
+            prompt = self._messages_to_prompt(fitted)
+            prompt_length = len(prompt)
+
+        # Log generation summary
         self.logger.info("============================================================")
         self.logger.info("🚀 Starting AI response generation")
         self.logger.info(f"📝 Prompt length: {prompt_length} characters")
@@ -191,7 +216,67 @@ class LocalLlamaRunner:
         self.logger.info("============================================================")
         self.logger.info(f"🔧 Generation parameters: temp={params['temperature']}, top_p={params.get('top_p', 0.9)}, max_tokens={max_tokens}")
 
-        self.progress_logger.start_inference(prompt_length, max_tokens)
+        return prompt, params
+
+    def _count_tokens(self, message: Dict[str, str]) -> int:
+        """Token count of one message including its role prefix, cached by content."""
+        content = message.get('content', '')
+        count = self._token_counts.get(content)
+        if count is None:
+            if len(self._token_counts) >= _TOKEN_COUNT_CACHE_SIZE:
+                self._token_counts.clear()
+            tokens = self.model.tokenize(content.encode('utf-8'), add_bos=False)
+            count = len(tokens) + _ROLE_PREFIX_TOKENS
+            self._token_counts[content] = count
+        return count
+
+    def _fit_context(self, messages: List[Dict[str, str]], budget: int) -> List[Dict[str, str]]:
+        """
+        Drop the oldest non-system messages until the prompt fits the token budget.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            budget: Tokens available for the prompt (context size minus max_tokens)
+
+        Returns:
+            messages itself if it fits, otherwise a shortened copy that keeps
+            system messages and the latest message
+        """
+        counts = [self._count_tokens(message) for message in messages]
+        total = sum(counts) + _ROLE_PREFIX_TOKENS  # final "Assistant:" cue
+        if total <= budget:
+            return messages
+
+        keep = [True] * len(messages)
+        for i, message in enumerate(messages[:-1]):
+            if total <= budget:
+                break
+            if message.get('role') != 'system':
+                keep[i] = False
+                total -= counts[i]
+        return [message for message, kept in zip(messages, keep) if kept]
+
+    def chat(self, messages: List[Dict[str, str]], **kwargs) -> str:
+        """
+        Generate chat response with detailed progress tracking and auto-optimized
+        parameters for short prompts.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            **kwargs: Additional generation parameters (override auto-tuning)
+
+        Returns:
+            Generated response text
+        """
+        with self._inference_lock:
+            return self._chat(messages, kwargs)
+
+    def _chat(self, messages: List[Dict[str, str]], kwargs: Dict) -> str:
+        """Generate a complete response; the caller holds the inference lock."""
+        if self.model is None:
+            return "[LOCAL MODEL ERROR] Model was unloaded"
+        prompt, params = self._prepare_generation(messages, kwargs)
+        self.progress_logger.start_inference(len(prompt), params["max_tokens"])
         start_time = time.time()
 
         try:
@@ -223,22 +308,77 @@ class LocalLlamaRunner:
                 pass
             return f"[LOCAL MODEL ERROR] {e}"
 
+    def chat_stream(self, messages: List[Dict[str, str]], **kwargs) -> Iterator[str]:
+        """
+        Generate chat response incrementally, yielding text chunks as the model
+        produces them.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            **kwargs: Additional generation parameters (override auto-tuning)
+
+        Yields:
+            Generated text chunks; on failure a single "[LOCAL MODEL ERROR] ..." chunk
+        """
+        with self._inference_lock:
+            yield from self._chat_stream(messages, kwargs)
+
+    def _chat_stream(self, messages: List[Dict[str, str]], kwargs: Dict) -> Iterator[str]:
+        """Stream a response; the caller holds the inference lock."""
+        if self.model is None:
+            yield "[LOCAL MODEL ERROR] Model was unloaded"
+            return
+        prompt, params = self._prepare_generation(messages, kwargs)
+        start_time = time.time()
+        tokens_generated = 0
+        started = False
+
+        # The streamed text itself is the progress indicator, so the stderr
+        # progress bar (which rewrites the current terminal line) is not used here
+        try:
+            for chunk in self.model(prompt, stream=True, **params):
+                text = chunk['choices'][0]['text']
+                if not started:
+                    # Mirror chat(): drop leading whitespace of the response
+                    text = text.lstrip()
+                    if not text:
+                        continue
+                    started = True
+                tokens_generated += 1
+                yield text
+
+            elapsed = time.time() - start_time
+            tokens_per_sec = tokens_generated / elapsed if elapsed > 0 else 0
+            self.logger.info(f"⚡ Performance: {tokens_per_sec:.2f} tokens/sec, {elapsed:.2f}s total")
+
+        except Exception as e:
+            self.logger.error(f"Failed to generate response: {e}")
+            yield f"[LOCAL MODEL ERROR] {e}"
+
     def _messages_to_prompt(self, messages: List[Dict[str, str]]) -> str:
         """Convert OpenAI-style messages to prompt format."""
-        prompt_parts = []
-        for message in messages:
-            role = message.get('role', 'user')
-            content = message.get('content', '')
-            if role == 'system':
-                prompt_parts.append(f"System: {content}")
-            elif role == 'user':
-                prompt_parts.append(f"User: {content}")
-            elif role == 'assistant':
-                prompt_parts.append(f"Assistant: {content}")
+        # Messages with unknown roles are dropped
+        prompt_parts = [
+            f"{_ROLE_PREFIXES[role]} {message.get('content', '')}"
+            for message in messages
+            if (role := message.get('role', 'user')) in _ROLE_PREFIXES
+        ]
         # Add final prompt for assistant response
         prompt_parts.append("Assistant:")
         return "\n".join(prompt_parts)
     
+    def close(self):
+        """
+        Release the model weights and KV cache held by llama-cpp.
+
+        Waits for a generation in progress to finish first, so the native
+        context is never freed while it is in use.
+        """
+        with self._inference_lock:
+            model, self.model = getattr(self, 'model', None), None
+        if model is not None and hasattr(model, 'close'):
+            model.close()
+
     def __del__(self):
         """Cleanup model when object is destroyed."""
         if hasattr(self, 'model'):
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Filesystem helpers for locating downloaded model files.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Tuple, Union
+
+# Last GGUF scan per cache root: {root: (cache signature, paths)}
+_GGUF_SCAN_CACHE: Dict[str, Tuple[Tuple, List[str]]] = {}
+
+
+def get_bielik_cache_dir() -> Path:
+    """Get Bielik's own cache directory ($XDG_CACHE_HOME/bielik or ~/.cache/bielik)."""
+    return Path(os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache'))) / 'bielik'
+
+
+def atomic_write(path: Union[str, os.PathLike], data: bytes) -> None:
+    """
+    Replace a file's contents atomically.
+
+    Symlinks are resolved first, so the link's target is updated and the link
+    itself is kept. An existing file keeps its permission bits; a new file is
+    created readable by its owner only. The temporary file is removed if
+    anything fails.
+
+    Args:
+        path: File to write
+        data: New contents
+
+    Raises:
+        OSError: If the file could not be written
+    """
+    target = os.path.realpath(path)
+    directory = os.path.dirname(target)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(target)}.",
+                                    suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        if os.path.exists(target):
+            shutil.copymode(target, tmp_path)
+        os.replace(tmp_path, target)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+@lru_cache(maxsize=1)
+def get_hf_home_dir() -> Path:
+    """
+    Get the Hugging Face home directory ($HF_HOME or ~/.cache/huggingface).
+
+    Resolved once per process; the result is a shared Path instance.
+    """
+    hf_home = os.environ.get('HF_HOME')
+    if hf_home:
+        return Path(hf_home)
+
+    cache_home = os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache'))
+    return Path(cache_home) / 'huggingface'
+
+
+def get_hub_cache_dir() -> Path:
+    """
+    Get the shared Hugging Face Hub cache directory.
+
+    Follows huggingface_hub's own resolution order: HUGGINGFACE_HUB_CACHE,
+    HF_HUB_CACHE, then $HF_HOME/hub, then ~/.cache/huggingface/hub.
+    """
+    hub_cache = os.environ.get('HUGGINGFACE_HUB_CACHE') or os.environ.get('HF_HUB_CACHE')
+    if hub_cache:
+        return Path(hub_cache).expanduser()
+
+    hf_home = os.environ.get('HF_HOME')
+    if hf_home:
+        return Path(hf_home).expanduser() / 'hub'
+
+    cache_home = os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache'))
+    return Path(cache_home) / 'huggingface' / 'hub'
+
+
+def hub_snapshots_dir(cache_dir: Union[str, os.PathLike], repo_id: str) -> Path:
+    """Get the snapshots directory of a model repo in a Hub-layout cache."""
+    return Path(cache_dir) / f"models--{repo_id.replace('/', '--')}" / 'snapshots'
+
+
+def find_gguf_files(root: Union[str, os.PathLike]) -> List[str]:
+    """
+    Recursively find GGUF model files under a directory.
+
+    Uses os.scandir, so file type checks come from the directory listing
+    itself instead of one stat() call per entry. Symlinked directories are
+    not followed; symlinked files (as in the HF cache snapshots) are returned.
+
+    Args:
+        root: Directory to search
+
+    Returns:
+        Paths of all *.gguf files found, or an empty list if root is missing
+    """
+    return _scan_gguf_files(os.fspath(root))[1]
+
+
+def _scan_gguf_files(root: str) -> Tuple[Tuple, List[str]]:
+    """
+    Walk root for GGUF files, also recording the mtime of every directory
+    listed. Adding or removing a file anywhere in the walk changes one of
+    those mtimes, so the recorded signature tells when the result is stale.
+
+    Returns:
+        (signature, paths), where signature holds (directory, mtime_ns or None)
+    """
+    signature = []
+    found = []
+    pending = [root]
+    while pending:
+        path = pending.pop()
+        # Hub repos keep content-addressed files in blobs/; their .gguf names
+        # only appear as snapshot symlinks, so blobs/ is never worth listing
+        in_hub_repo = os.path.basename(path).startswith('models--')
+        # Stat before listing, so a change made during the walk is seen next
+        # time; a missing directory is recorded so its creation is noticed
+        try:
+            signature.append((path, os.stat(path).st_mtime_ns))
+        except OSError:
+            signature.append((path, None))
+            continue
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not (in_hub_repo and entry.name == 'blobs'):
+                            pending.append(entry.path)
+                    elif entry.name.endswith('.gguf'):
+                        found.append(entry.path)
+        except OSError:
+            # Unreadable directory
+            continue
+    return tuple(signature), found
+
+
+def _signature_current(signature: Tuple) -> bool:
+    """Check that every directory of a scan signature still has its recorded mtime."""
+    for path, mtime_ns in signature:
+        try:
+            if os.stat(path).st_mtime_ns != mtime_ns:
+                return False
+        except OSError:
+            if mtime_ns is not None:
+                return False
+    return True
+
+
+def _scan_file() -> Path:
+    """GGUF scans persisted for later processes, e.g. one-shot `bielik -p` runs."""
+    return get_bielik_cache_dir() / 'gguf_scan.json'
+
+
+def _load_scan_file() -> Dict[str, Tuple[Tuple, List[str]]]:
+    """Read persisted GGUF scans; a missing or corrupt file yields no entries."""
+    try:
+        with open(_scan_file(), encoding='utf-8') as f:
+            data = json.load(f)
+        return {root: (tuple(tuple(item) for item in entry['signature']), entry['paths'])
+                for root, entry in data.items()}
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return {}
+
+
+def _save_scan_file(scans: Dict[str, Tuple[Tuple, List[str]]]) -> None:
+    """Persist GGUF scans; failures only cost a rescan next time."""
+    data = {root: {'signature': signature, 'paths': paths}
+            for root, (signature, paths) in scans.items()}
+    try:
+        atomic_write(_scan_file(), json.dumps(data).encode('utf-8'))
+    except OSError:
+        pass
+
+
+def find_gguf_files_cached(root: Union[str, os.PathLike]) -> List[str]:
+    """
+    Like find_gguf_files(), but reuse the previous result for the same root
+    while none of the directories it walked has changed.
+
+    Results are also persisted under the Bielik cache dir, so a new process
+    only has to stat the walked directories instead of listing them.
+
+    Args:
+        root: Directory to search
+
+    Returns:
+        Paths of all *.gguf files found (a new list on every call)
+    """
+    root = os.fspath(root)
+    cached = _GGUF_SCAN_CACHE.get(root)
+    if cached is None or not _signature_current(cached[0]):
+        persisted = _load_scan_file()
+        cached = persisted.get(root)
+        if cached is None or not _signature_current(cached[0]):
+            cached = _scan_gguf_files(root)
+            persisted[root] = cached
+            _save_scan_file(persisted)
+        _GGUF_SCAN_CACHE[root] = cached
+    return list(cached[1])
@@ -5,6 +5,7 @@ Model loading utilities with timeout handling for Bielik HuggingFace integration
 
 import os
 import signal
+import threading
 import time
 from typing import Any, Callable
 
@@ -26,6 +27,32 @@ def timeout_handler(signum, frame):
     raise ModelLoadingTimeoutError("Model loading timed out")
 
 
+def _load_in_thread(loader_func: Callable, timeout: int, **kwargs) -> Any:
+    """
+    Timeout for loads started off the main thread (e.g. model preloading).
+    
+    The loader runs in a daemon thread that the caller stops waiting for after
+    timeout seconds. A native load cannot be interrupted, so a hung loader is
+    abandoned rather than cancelled; its result, if any, is dropped.
+    """
+    outcome = {}
+    
+    def run():
+        try:
+            outcome["result"] = loader_func(**kwargs)
+        except BaseException as e:
+            outcome["error"] = e
+    
+    worker = threading.Thread(target=run, name="bielik-model-load", daemon=True)
+    worker.start()
+    worker.join(timeout)
+    if worker.is_alive():
+        raise ModelLoadingTimeoutError("Model loading timed out")
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
+
+
 def load_with_timeout(loader_func: Callable, timeout: int, **kwargs) -> Any:
     """
     Load model with timeout protection.
@@ -41,6 +68,10 @@ def load_with_timeout(loader_func: Callable, timeout: int, **kwargs) -> Any:
     Raises:
         ModelLoadingTimeoutError: If loading times out
     """
+    # SIGALRM handlers can only be installed from the main thread
+    if threading.current_thread() is not threading.main_thread():
+        return _load_in_thread(loader_func, timeout, **kwargs)
+    
     # Set up signal handler for timeout
     old_handler = signal.signal(signal.SIGALRM, timeout_handler)
     signal.alarm(timeout)
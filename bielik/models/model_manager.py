@@ -8,19 +8,24 @@ from __future__ import annotations
 
 import json
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Any
+from dataclasses import dataclass, asdict
+from typing import Dict, FrozenSet, List, Optional, Any
 
 try:
     from huggingface_hub import hf_hub_download, list_repo_files, HfApi
+    from huggingface_hub.utils import HfHubHTTPError
     HAS_HF_HUB = True
 except ImportError:
     HAS_HF_HUB = False
 
 from ..config import get_config, get_logger
 from .model_exceptions import ModelLoadingError
+from .model_files import find_gguf_files, get_hub_cache_dir, hub_snapshots_dir
 from .model_registry import ModelInfo
 
 logger = get_logger(__name__)
@@ -56,6 +61,9 @@ class SpeakLeashModelManager:
         }
     }
     
+    # Immutable name set for membership checks in hot paths
+    SPEAKLEASH_MODELS_SET = frozenset(SPEAKLEASH_MODELS)
+    
     def __init__(self, models_dir: Optional[str] = None):
         """
         Initialize model manager.
@@ -82,6 +90,15 @@ class SpeakLeashModelManager:
         self.registry = {}
         self._models_initialized = False
         
+        # Registry entries verified to exist on disk, reused while the registry
+        # file mtime is unchanged; invalidated on download/delete
+        self._manifest_cache: Optional[Dict[str, ModelInfo]] = None
+        self._manifest_names: FrozenSet[str] = frozenset()
+        self._manifest_mtime: Optional[int] = None
+        
+        # Guards registry updates when several downloads finish concurrently
+        self._registry_lock = threading.Lock()
+        
         self.logger.info(f"Model manager initialized (lazy loading enabled) with directory: {self.models_dir}")
     
     def initialize_models(self):
@@ -185,10 +202,30 @@ class SpeakLeashModelManager:
             for name, info in self.SPEAKLEASH_MODELS.items()
         ]
     
-    def list_downloaded_models(self) -> Dict[str, ModelInfo]:
-        """List all downloaded models."""
+    def _registry_mtime(self) -> Optional[int]:
+        """Return the registry file mtime in ns, or None if it is missing."""
+        try:
+            return self.registry_file.stat().st_mtime_ns
+        except OSError:
+            return None
+    
+    def _invalidate_manifest(self):
+        """Force the next manifest read to re-verify model files."""
+        self._manifest_cache = None
+    
+    def _get_manifest(self) -> Dict[str, ModelInfo]:
+        """
+        Get registry entries whose model files exist.
+        
+        Files are only re-checked when the registry file changes or after a
+        download/delete; a model file removed by hand in the meantime is
+        reported when loading it fails.
+        """
         self._ensure_initialized()
         
+        if self._manifest_cache is not None and self._registry_mtime() == self._manifest_mtime:
+            return self._manifest_cache
+        
         # Verify that files still exist
         valid_registry = {}
         for name, model_info in self.registry.items():
@@ -202,12 +239,72 @@ class SpeakLeashModelManager:
             self.registry = valid_registry
             self._save_registry()
         
-        return self.registry.copy()
+        self._manifest_cache = dict(self.registry)
+        self._manifest_names = frozenset(self._manifest_cache)
+        self._manifest_mtime = self._registry_mtime()
+        return self._manifest_cache
+    
+    def list_downloaded_models(self) -> Dict[str, ModelInfo]:
+        """List all downloaded models."""
+        return self._get_manifest().copy()
+    
+    def downloaded_model_names(self) -> FrozenSet[str]:
+        """Names of downloaded models, without copying their ModelInfo entries."""
+        self._get_manifest()
+        return self._manifest_names
     
     def is_model_downloaded(self, model_name: str) -> bool:
-        """Check if a model is downloaded."""
+        """Check if a model is downloaded (or available in the shared HF cache)."""
         self._ensure_initialized()
-        return model_name in self.registry
+        return model_name in self.registry or self._adopt_from_hub_cache(model_name) is not None
+    
+    def _adopt_from_hub_cache(self, model_name: str) -> Optional[ModelInfo]:
+        """
+        Register a model already present in the shared Hugging Face Hub cache.
+        
+        Lets a warm HUGGINGFACE_HUB_CACHE / HF_HOME (e.g. a shared cluster or CI
+        cache) be used in place without downloading into the models directory.
+        The entry is marked external, so deleting the model only unregisters it.
+        
+        Args:
+            model_name: Name of a SpeakLeash model
+            
+        Returns:
+            ModelInfo of the adopted file, or None if the cache has no GGUF file for it
+        """
+        if model_name not in self.SPEAKLEASH_MODELS_SET:
+            return None
+        
+        model_config = self.SPEAKLEASH_MODELS[model_name]
+        repo_id = model_config["repo_id"]
+        gguf_files = find_gguf_files(hub_snapshots_dir(get_hub_cache_dir(), repo_id))
+        if not gguf_files:
+            return None
+        
+        by_name = {os.path.basename(path): path for path in gguf_files}
+        target_file = self._choose_best_gguf_file(sorted(by_name))
+        local_path = by_name[target_file]
+        
+        model_info = ModelInfo(
+            name=model_name,
+            repo_id=repo_id,
+            file_name=target_file,
+            local_path=local_path,
+            size_bytes=Path(local_path).stat().st_size,
+            downloaded_at=datetime.now().isoformat(),
+            model_type="gguf",
+            description=model_config.get("description", ""),
+            parameters=model_config.get("parameters", ""),
+            version=model_config.get("version", ""),
+            external=True
+        )
+        with self._registry_lock:
+            self.registry[model_name] = model_info
+            self._save_registry()
+            self._invalidate_manifest()
+        
+        self.logger.info(f"Using {model_name} from the Hugging Face cache: {local_path}")
+        return model_info
     
     def get_model_files(self, repo_id: str) -> List[str]:
         """Get list of GGUF files in repository."""
@@ -230,7 +327,7 @@ class SpeakLeashModelManager:
         Returns:
             ModelInfo if successful, None otherwise
         """
-        if model_name not in self.SPEAKLEASH_MODELS:
+        if model_name not in self.SPEAKLEASH_MODELS_SET:
             self.logger.error(f"Unknown model: {model_name}")
             self.logger.info(f"Available models: {list(self.SPEAKLEASH_MODELS.keys())}")
             return None
@@ -283,8 +380,10 @@ class SpeakLeashModelManager:
             )
             
             # Update registry
-            self.registry[model_name] = model_info
-            self._save_registry()
+            with self._registry_lock:
+                self.registry[model_name] = model_info
+                self._save_registry()
+                self._invalidate_manifest()
             
             self.logger.info(f"Successfully downloaded {model_name} to {local_path}")
             self.logger.info(f"File size: {file_size / (1024*1024*1024):.2f} GB")
@@ -298,6 +397,32 @@ class SpeakLeashModelManager:
             self.logger.error(f"Unexpected error downloading {model_name}: {e}")
             return None
     
+    def download_models(self, model_names: List[str], workers: int = 4,
+                        force: bool = False) -> Dict[str, Optional[ModelInfo]]:
+        """
+        Download several SpeakLeash models concurrently.
+        
+        Each model is a single GGUF file, so models rather than shards are
+        downloaded in parallel, one per worker thread.
+        
+        Args:
+            model_names: Names of the models to download
+            workers: Maximum number of simultaneous downloads
+            force: Force re-download even if a model exists
+            
+        Returns:
+            Dictionary mapping each model name to its ModelInfo, or None if it failed
+        """
+        self._ensure_initialized()
+        names = list(dict.fromkeys(model_names))
+        if not names:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(names))),
+                                thread_name_prefix="bielik-download") as pool:
+            results = pool.map(lambda name: self.download_model(name, force=force), names)
+            return dict(zip(names, results))
+    
     def _choose_best_gguf_file(self, gguf_files: List[str]) -> str:
         """Choose the best GGUF file from available options."""
         # Preference order: q4_0, q4_1, q5_0, q5_1, q8_0, f16, f32
@@ -328,15 +453,19 @@ class SpeakLeashModelManager:
         model_info = self.registry[model_name]
         
         try:
-            # Delete the model file
+            # Delete the model file, unless it belongs to the shared HF cache
             model_path = Path(model_info.local_path)
-            if model_path.exists():
+            if model_info.external:
+                self.logger.info(f"Keeping {model_path}, it belongs to the Hugging Face cache")
+            elif model_path.exists():
                 model_path.unlink()
                 self.logger.info(f"Deleted model file: {model_path}")
             
             # Remove from registry
-            del self.registry[model_name]
-            self._save_registry()
+            with self._registry_lock:
+                del self.registry[model_name]
+                self._save_registry()
+                self._invalidate_manifest()
             
             self.logger.info(f"Successfully deleted model {model_name}")
             return True
@@ -350,6 +479,12 @@ class SpeakLeashModelManager:
         self._ensure_initialized()
         return self.registry.get(model_name)
     
+    def resolve_downloaded(self, model_name: str) -> Optional[str]:
+        """Get the local path of a downloaded model, or None, in a single registry lookup."""
+        self._ensure_initialized()
+        model_info = self.registry.get(model_name) or self._adopt_from_hub_cache(model_name)
+        return model_info.local_path if model_info else None
+    
     def get_model_path(self, model_name: str) -> Optional[str]:
         """Get local path for a downloaded model."""
         self._ensure_initialized()
@@ -362,18 +497,21 @@ class SpeakLeashModelManager:
         """Get storage statistics for downloaded models."""
         total_size = 0
         model_count = 0
+        models = {}
         
-        for model_info in self.registry.values():
-            if Path(model_info.local_path).exists():
-                total_size += model_info.size_bytes
-                model_count += 1
+        for name, model_info in self._get_manifest().items():
+            total_size += model_info.size_bytes
+            model_count += 1
+            models[name] = {"size_bytes": model_info.size_bytes, "local_path": model_info.local_path}
         
         return {
             "total_models": model_count,
             "total_size_bytes": total_size,
             "total_size_gb": total_size / (1024**3),
             "models_directory": str(self.models_dir),
-            "registry_file": str(self.registry_file)
+            "hub_cache_directory": str(get_hub_cache_dir()),
+            "registry_file": str(self.registry_file),
+            "models": models
         }
 
 
@@ -20,4 +20,7 @@ class ModelInfo:
     description: str = ""
     parameters: str = ""
     version: str = ""
+    # Set for files used in place from the shared Hugging Face cache, which
+    # Bielik does not own and never deletes
+    external: bool = False
 
@@ -3,14 +3,16 @@
 Bielik FastAPI Server - Provides REST and WebSocket API for local HuggingFace models.
 """
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 import os
-import json
 from typing import List, Dict
 
+from ._compat import HAS_ORJSON, json_loads as _json_loads
 from .config import get_config, get_logger
 from .hf_models import LocalLlamaRunner
 
+_ChatResponse = ORJSONResponse if HAS_ORJSON else JSONResponse
+
 config = get_config()
 logger = get_logger(__name__)
 
@@ -104,14 +106,15 @@ async def chat_endpoint(req: Request):
         }
     """
     try:
-        payload = await req.json()
+        payload = _json_loads(await req.body())
         messages = payload.get("messages")
         
         if not messages:
             return JSONResponse({"error": "messages required"}, status_code=400)
         
         response = query_local_model(messages)
-        return {"reply": response}
+        # Returning a response object skips FastAPI's generic jsonable_encoder pass
+        return _ChatResponse({"reply": response})
         
     except Exception as e:
         logger.error(f"Chat endpoint error: {e}")
@@ -135,7 +138,7 @@ async def websocket_chat(websocket: WebSocket):
             
             # Parse incoming message
             try:
-                obj = json.loads(data)
+                obj = _json_loads(data)
                 if isinstance(obj, dict) and "content" in obj:
                     user_text = obj["content"]
                 else:
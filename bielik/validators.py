@@ -13,12 +13,22 @@ import re
 import ast
 import json
 import hashlib
+from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple, Union
 from dataclasses import dataclass
 from bs4 import BeautifulSoup
 import xml.etree.ElementTree as ET
 
+# Compiled once; used by EnvFileValidator for *_HOST / *_URL values
+_URL_RE = re.compile(
+    r'^https?://'  # http:// or https://
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
+    r'localhost|'  # localhost...
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
+    r'(?::\d+)?'  # optional port
+    r'(?:/?|[/?]\S+)$', re.IGNORECASE)
+
 
 @dataclass
 class ValidationResult:
@@ -254,7 +264,6 @@ class HTMLArtifactValidator:
     def _validate_iso_datetime(self, datetime_str: str) -> bool:
         """Validate ISO datetime format."""
         try:
-            from datetime import datetime
             datetime.fromisoformat(datetime_str.replace('Z', '+00:00'))
             return True
         except ValueError:
@@ -409,7 +418,7 @@ class EnvFileValidator:
             value = var_info['value']
             
             # Validate URLs
-            if var_name.endswith('_HOST') or var_name.endswith('_URL'):
+            if var_name.endswith(('_HOST', '_URL')):
                 if not self._validate_url_format(value):
                     errors.append(f"Invalid URL format for {var_name}: {value}")
             
@@ -449,15 +458,7 @@ class EnvFileValidator:
     
     def _validate_url_format(self, url: str) -> bool:
         """Validate URL format."""
-        import re
-        url_pattern = re.compile(
-            r'^https?://'  # http:// or https://
-            r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
-            r'localhost|'  # localhost...
-            r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-            r'(?::\d+)?'  # optional port
-            r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-        return bool(url_pattern.match(url))
+        return bool(_URL_RE.match(url))
 
 
 class CommandScriptValidator:
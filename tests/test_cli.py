@@ -168,3 +168,264 @@ def test_calc_command_integration():
     except ImportError:
         # Skip test if calc command not available
         pytest.skip("Calc command not available")
+
+
+def test_context_provider_prefilter_rejects_non_identifiers():
+    """Chat text with ':' that is not an identifier never reaches the registry."""
+    processor = CommandProcessor()
+
+    with patch.object(processor.command_registry, 'get_command') as get_command:
+        assert not processor._is_context_provider_command("see ./docs/a.md: note")
+        assert not processor._is_context_provider_command("meet at 10:30")
+        assert not processor._is_context_provider_command("a b: c")
+        get_command.assert_not_called()
+
+
+def test_command_registry_get_uses_cached_names(tmp_path):
+    """Registry.get answers misses from the cached name set and rescans after invalidate()."""
+    from bielik.cli.command_api import CommandRegistry
+
+    registry = CommandRegistry(str(tmp_path))
+    assert registry.get("calc") is None
+    assert registry.command_names() == frozenset()
+
+    (tmp_path / "calc").mkdir()
+    (tmp_path / "calc" / "main.py").write_text("")
+    assert "calc" not in registry.command_names()
+
+    registry.invalidate()
+    assert registry.command_names() == frozenset({"calc"})
+
+
+def test_process_command_returns_command_result():
+    """Built-in commands report their outcome as a CommandResult."""
+    from bielik.cli.commands import CommandResult
+    processor = CommandProcessor()
+    messages = [{"role": "system", "content": "test"}]
+
+    result = processor.process_command(":exit", messages, "test-model")
+    assert isinstance(result, CommandResult)
+    assert not result.continue_chat
+    assert result.kind == "none"
+
+    result = processor.process_command(":clear", messages, "test-model")
+    assert result.continue_chat
+    assert result.kind == "none"
+    assert len(result.messages) == 1
+
+
+def test_download_bielik_not_shadowed_by_download():
+    """':download-bielik' reaches its own handler, not ':download'."""
+    processor = CommandProcessor()
+    messages = [{"role": "system", "content": "test"}]
+
+    with patch.object(processor, '_show_bielik_models') as show, \
+            patch.object(processor.model_manager, 'download_model') as download:
+        result = processor.process_command(":download-bielik", messages, "test-model")
+        show.assert_called_once()
+        download.assert_not_called()
+    assert result.continue_chat
+
+
+def _fake_runner(model_path):
+    """A LocalLlamaRunner with a mock model instead of a loaded GGUF file."""
+    import threading
+    from bielik.models.local_runner import LocalLlamaRunner
+
+    runner = LocalLlamaRunner.__new__(LocalLlamaRunner)
+    runner._inference_lock = threading.Lock()
+    runner.model = Mock()
+    runner.model_path = model_path
+    return runner
+
+
+def _communicator(monkeypatch, cache_size):
+    from bielik.cli import send_chat as send_chat_module
+
+    communicator = send_chat_module.ChatCommunicator()
+    communicator.config = Mock(MODEL_CACHE_SIZE=cache_size)
+    communicator._model_manager = Mock(resolve_downloaded=lambda model: f"/models/{model}.gguf")
+    monkeypatch.setattr(send_chat_module, 'HAS_LLAMA_CPP', True)
+    return communicator
+
+
+def test_evicted_runner_is_closed_after_its_generation(monkeypatch):
+    """Evicting a runner waits for the generation running on it before closing."""
+    import threading
+
+    communicator = _communicator(monkeypatch, cache_size=1)
+    monkeypatch.setattr(communicator, '_load_runner', _fake_runner)
+
+    runner_a, _ = communicator._get_runner('a')
+    model_a = runner_a.model
+    runner_a._inference_lock.acquire()  # generation in progress on 'a'
+
+    loader = threading.Thread(target=communicator._get_runner, args=('b',))
+    loader.start()
+    loader.join(0.2)
+    assert loader.is_alive()
+    assert runner_a.model is model_a
+    model_a.close.assert_not_called()
+
+    runner_a._inference_lock.release()
+    loader.join(2)
+    assert not loader.is_alive()
+    assert runner_a.model is None
+    model_a.close.assert_called_once()
+    assert list(communicator._model_cache) == ['b']
+
+
+def test_model_load_does_not_block_cache_hits(monkeypatch):
+    """A slow load of one model leaves other cached models available."""
+    import threading
+
+    communicator = _communicator(monkeypatch, cache_size=2)
+    release = threading.Event()
+
+    def load(model_path):
+        if 'slow' in model_path:
+            release.wait(2)
+        return _fake_runner(model_path)
+
+    monkeypatch.setattr(communicator, '_load_runner', load)
+    cached, _ = communicator._get_runner('fast')
+
+    loader = threading.Thread(target=communicator._get_runner, args=('slow',))
+    loader.start()
+    try:
+        hit = []
+        reader = threading.Thread(target=lambda: hit.append(communicator._get_runner('fast')[0]))
+        reader.start()
+        reader.join(0.5)
+        assert hit == [cached]
+    finally:
+        release.set()
+        loader.join(2)
+
+
+def test_background_model_load_times_out():
+    """Loads started off the main thread still honour the load timeout."""
+    import threading
+    from bielik.models.model_exceptions import ModelLoadingTimeoutError
+    from bielik.models.model_loading import load_with_timeout
+
+    release = threading.Event()
+    outcome = []
+
+    def load_in_background():
+        try:
+            load_with_timeout(lambda: release.wait(5), timeout=1)
+        except ModelLoadingTimeoutError as e:
+            outcome.append(e)
+
+    worker = threading.Thread(target=load_in_background)
+    worker.start()
+    worker.join(3)
+    release.set()
+    assert not worker.is_alive()
+    assert len(outcome) == 1
+
+
+def test_settings_save_keeps_env_symlink_and_mode(tmp_path, monkeypatch):
+    """Saving settings updates a symlinked .env in place and keeps its permissions."""
+    import stat
+    from bielik.cli.settings import CLISettingsManager
+
+    real_env = tmp_path / 'secrets.env'
+    real_env.write_text('HF_TOKEN="hf_secret"\n')
+    real_env.chmod(0o600)
+    (tmp_path / '.env').symlink_to(real_env)
+    monkeypatch.chdir(tmp_path)
+
+    settings = CLISettingsManager()
+    assert settings.set_user_name('tester')
+
+    assert (tmp_path / '.env').is_symlink()
+    assert stat.S_IMODE(real_env.stat().st_mode) == 0o600
+    content = real_env.read_text()
+    assert 'HF_TOKEN="hf_secret"' in content
+    assert 'BIELIK_CLI_USERNAME="Tester"' in content
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['.env', 'secrets.env']
+
+
+def test_model_availability_rechecks_missing_models(tmp_path, monkeypatch):
+    """Only available models are served from the cache; a miss is checked again."""
+    import importlib
+    cli_main = importlib.import_module('bielik.cli.main')
+
+    monkeypatch.setattr(cli_main, 'MODELS_CACHE_FILE', tmp_path / 'models.json')
+    registry_file = tmp_path / 'model_registry.json'
+    registry_file.write_text('{}')
+    manager = Mock(SPEAKLEASH_MODELS_SET={'m'}, registry_file=registry_file)
+
+    manager.is_model_downloaded.return_value = False
+    assert not cli_main.validate_model_availability('m', manager)
+
+    manager.is_model_downloaded.return_value = True
+    assert cli_main.validate_model_availability('m', manager)
+
+    manager.is_model_downloaded.return_value = False
+    assert cli_main.validate_model_availability('m', manager)
+    assert manager.is_model_downloaded.call_count == 2
+
+
+def test_query_many_stops_when_model_cannot_load():
+    """A failed up-front load fails the batch instead of retrying per query."""
+    import asyncio
+    from bielik.client.core import BielikClient
+
+    client = BielikClient.__new__(BielikClient)
+    client.logger = Mock()
+    client.model_path = '/missing.gguf'
+    client.model_kwargs = {}
+    client.model_manager = Mock()
+    client.model_manager.initialize_local_runner.return_value = False
+
+    replies = asyncio.run(client.query_many(['a', 'b', 'c']))
+
+    assert replies == ["[ERROR] Failed to initialize local model runner"] * 3
+    client.model_manager.initialize_local_runner.assert_called_once()
+
+
+def test_settings_parsed_from_env_file(tmp_path, monkeypatch):
+    """Only BIELIK_CLI_* assignments are read; comments and other keys are ignored."""
+    from bielik.cli.settings import CLISettingsManager
+
+    (tmp_path / '.env').write_text(
+        'HF_TOKEN="hf_secret"\n'
+        '# BIELIK_CLI_USERNAME="Commented"\n'
+        '  BIELIK_CLI_USERNAME = "Ala"\n'
+        "BIELIK_CLI_ASSISTANT_NAME='bielik-7b'\n"
+        'BIELIK_CLI_AUTO_SWITCH=false\n'
+        'BIELIK_CLI_UNKNOWN="ignored"\n'
+    )
+    monkeypatch.chdir(tmp_path)
+
+    settings = CLISettingsManager()
+
+    assert settings.get_user_name() == 'Ala'
+    assert settings.get_assistant_name() == 'bielik-7b'
+    assert settings.get_current_model() is None
+    assert settings._settings['auto_switch_after_download'] is False
+
+
+def test_settings_env_cache_skips_unchanged_file(tmp_path, monkeypatch):
+    """An unchanged .env is parsed once; a changed one is read again."""
+    from pathlib import Path
+    from bielik.cli.settings import CLISettingsManager
+
+    env_file = tmp_path / '.env'
+    env_file.write_text('BIELIK_CLI_USERNAME="Ala"\n')
+    monkeypatch.chdir(tmp_path)
+    read_text = Mock(side_effect=Path.read_text)
+    monkeypatch.setattr(Path, 'read_text', lambda self, *a, **kw: read_text(self, *a, **kw))
+
+    assert CLISettingsManager().get_user_name() == 'Ala'
+    assert CLISettingsManager().get_user_name() == 'Ala'
+    assert read_text.call_count == 1
+
+    env_file.write_text('BIELIK_CLI_USERNAME="Ola"\n')
+    st = env_file.stat()
+    os.utime(env_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert CLISettingsManager().get_user_name() == 'Ola'
+    assert read_text.call_count == 2
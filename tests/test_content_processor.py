@@ -0,0 +1,25 @@
+import pytest
+from unittest.mock import Mock, patch
+from bielik.content_processor import ContentProcessor
+
+
+@pytest.fixture
+def processor():
+    config = Mock(BLOCKED_DOMAINS=['example.com', ' .Tracker.NET ', ''])
+    with patch('bielik.content_processor.get_config', return_value=config):
+        return ContentProcessor()
+
+
+@pytest.mark.parametrize('url, blocked', [
+    ('https://example.com/page', True),
+    ('https://www.example.com/page', True),
+    ('http://user:pw@a.b.example.com:8080/', True),
+    ('https://EXAMPLE.COM', True),
+    ('https://ads.tracker.net/x.js', True),
+    ('https://notexample.com/', False),
+    ('https://example.com.evil.org/', False),
+    ('https://example.org/', False),
+    ('not a url', False),
+])
+def test_blocked_domain_matches_host_and_subdomains(processor, url, blocked):
+    assert processor.is_blocked_domain(url) is blocked
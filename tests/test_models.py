@@ -0,0 +1,150 @@
+import pytest
+from datetime import datetime
+from bielik.models.model_manager import SpeakLeashModelManager
+
+
+@pytest.fixture
+def hub_cache(tmp_path, monkeypatch):
+    """An empty shared Hugging Face cache, isolated from the user's own."""
+    cache = tmp_path / 'hub'
+    monkeypatch.setenv('HUGGINGFACE_HUB_CACHE', str(cache))
+    return cache
+
+
+def test_deleting_adopted_model_keeps_hub_cache_file(tmp_path, hub_cache):
+    """A model used in place from the HF cache is only unregistered on delete."""
+    from bielik.models.model_files import hub_snapshots_dir
+
+    manager = SpeakLeashModelManager(str(tmp_path / 'models'))
+    name, model_config = next(iter(manager.SPEAKLEASH_MODELS.items()))
+    snapshot = hub_snapshots_dir(hub_cache, model_config['repo_id']) / 'abc123'
+    snapshot.mkdir(parents=True)
+    gguf = snapshot / 'model.q4_0.gguf'
+    gguf.write_bytes(b'GGUF')
+
+    assert manager.resolve_downloaded(name) == str(gguf)
+    model_info = manager.get_model_info(name)
+    assert model_info.external
+    datetime.fromisoformat(model_info.downloaded_at)
+
+    assert manager.delete_model(name)
+    assert gguf.exists()
+    assert name not in manager.registry
+
+
+def test_cached_gguf_scan_sees_files_added_anywhere(tmp_path, monkeypatch):
+    """A GGUF file added outside the hub layout invalidates the cached scan."""
+    from bielik.models import model_files
+
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'xdg'))
+    monkeypatch.setattr(model_files, '_GGUF_SCAN_CACHE', {})
+    root = tmp_path / 'hf'
+    (root / 'local').mkdir(parents=True)
+    (root / 'a.gguf').write_bytes(b'GGUF')
+
+    assert model_files.find_gguf_files_cached(root) == [str(root / 'a.gguf')]
+
+    (root / 'local' / 'b.gguf').write_bytes(b'GGUF')
+    expected = sorted([str(root / 'a.gguf'), str(root / 'local' / 'b.gguf')])
+    assert sorted(model_files.find_gguf_files_cached(root)) == expected
+
+    # A new process reads the persisted scan and must see it is current
+    monkeypatch.setattr(model_files, '_GGUF_SCAN_CACHE', {})
+    assert sorted(model_files.find_gguf_files_cached(root)) == expected
+
+
+def test_manifest_reverified_after_invalidation(tmp_path, hub_cache):
+    """The verified manifest is reused until the registry changes or is invalidated."""
+    from bielik.models.model_registry import ModelInfo
+
+    models_dir = tmp_path / 'models'
+    gguf = models_dir / 'models--org--repo' / 'snapshots' / 'abc123' / 'model.gguf'
+    gguf.parent.mkdir(parents=True)
+    gguf.write_bytes(b'GGUF')
+
+    manager = SpeakLeashModelManager(str(models_dir))
+    manager.initialize_models()
+    manager.registry['m'] = ModelInfo(name='m', repo_id='org/repo', file_name='model.gguf',
+                                      local_path=str(gguf), size_bytes=4, downloaded_at='')
+    assert manager.downloaded_model_names() == frozenset({'m'})
+
+    gguf.unlink()
+    assert manager.downloaded_model_names() == frozenset({'m'})
+
+    manager._invalidate_manifest()
+    assert manager.downloaded_model_names() == frozenset()
+
+
+def _word_counting_runner():
+    """A LocalLlamaRunner whose model counts one token per word."""
+    from unittest.mock import Mock
+    from bielik.models.local_runner import LocalLlamaRunner
+
+    runner = LocalLlamaRunner.__new__(LocalLlamaRunner)
+    runner.model = Mock()
+    runner.model.tokenize.side_effect = lambda text, add_bos=False: text.split()
+    runner._token_counts = {}
+    return runner
+
+
+def _conversation():
+    # 10 words each: 14 tokens with the role prefix, 60 in total with the final cue
+    words = ' '.join(['word'] * 9)
+    return [
+        {'role': 'system', 'content': f'system {words}'},
+        {'role': 'user', 'content': f'first {words}'},
+        {'role': 'assistant', 'content': f'answer {words}'},
+        {'role': 'user', 'content': f'second {words}'},
+    ]
+
+
+@pytest.mark.parametrize('budget, kept', [
+    (60, [0, 1, 2, 3]),
+    (50, [0, 2, 3]),
+    (40, [0, 3]),
+])
+def test_fit_context_drops_oldest_turns(budget, kept):
+    """The oldest non-system messages go first, until the prompt fits."""
+    messages = _conversation()
+    fitted = _word_counting_runner()._fit_context(messages, budget)
+    assert fitted == [messages[i] for i in kept]
+
+
+def test_fit_context_returns_messages_unchanged_when_they_fit():
+    messages = _conversation()
+    assert _word_counting_runner()._fit_context(messages, 100) is messages
+
+
+def test_fit_context_keeps_system_and_last_message_over_budget():
+    """System messages and the latest message are kept even if they alone exceed the budget."""
+    messages = _conversation()
+    fitted = _word_counting_runner()._fit_context(messages, 10)
+    assert fitted == [messages[0], messages[-1]]
+
+
+def test_download_models_runs_downloads_concurrently(tmp_path, monkeypatch):
+    """Models download in parallel, duplicates once each, with results by name."""
+    import threading
+
+    manager = SpeakLeashModelManager(str(tmp_path / 'models'))
+    names = list(manager.SPEAKLEASH_MODELS)[:3]
+    all_started = threading.Barrier(len(names), timeout=2)
+    calls = []
+
+    def download_model(name, force=False):
+        calls.append((name, force))
+        all_started.wait()  # raises BrokenBarrierError unless all run at once
+        return None if name == names[1] else f'info-{name}'
+
+    monkeypatch.setattr(manager, 'download_model', download_model)
+
+    results = manager.download_models(names + [names[0]], workers=4, force=True)
+
+    assert list(results) == names
+    assert results == {names[0]: f'info-{names[0]}', names[1]: None, names[2]: f'info-{names[2]}'}
+    assert sorted(calls) == sorted((name, True) for name in names)
+
+
+def test_download_models_with_no_names(tmp_path):
+    manager = SpeakLeashModelManager(str(tmp_path / 'models'))
+    assert manager.download_models([]) == {}